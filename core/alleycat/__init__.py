@@ -0,0 +1,6 @@
+import os
+
+if os.environ.get("ALLEYCAT_PROFILE_STARTUP"):
+    from alleycat.common.profiler import profile_imports
+
+    profile_imports()
@@ -1,5 +1,20 @@
-from .errors import IllegalStateError, InvalidTypeError
-from .logging import LoggingSupport
-from .geometry import Point2D
-from .validators import maybe_type, of_type, require_type
-from .mapping import MapReader
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".errors": ("IllegalStateError", "InvalidTypeError"),
+    ".logging": ("LoggingSupport",),
+    ".geometry": ("Point2D",),
+    ".validators": ("maybe_type", "of_type", "require_type"),
+    ".mapping": ("MapReader",),
+    ".profiler": ("StartupProfiler", "TraceEvent", "describe", "profile_imports", "stop_profiling_imports")
+})
+
+if TYPE_CHECKING:
+    from .errors import IllegalStateError, InvalidTypeError
+    from .logging import LoggingSupport
+    from .geometry import Point2D
+    from .validators import maybe_type, of_type, require_type
+    from .mapping import MapReader
+    from .profiler import StartupProfiler, TraceEvent, describe, profile_imports, stop_profiling_imports
@@ -0,0 +1,25 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+
+def lazy_exports(package: str, exports: Mapping[str, Tuple[str, ...]]) \
+        -> Tuple[Callable[[str], Any], Callable[[], List[str]], Tuple[str, ...]]:
+    modules: Dict[str, str] = {name: module for (module, names) in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+
+        if module is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        value = getattr(import_module(module, package), name)
+
+        setattr(sys.modules[package], name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | modules.keys())
+
+    return __getattr__, __dir__, tuple(modules.keys())
@@ -0,0 +1,191 @@
+import json
+import os
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class TraceEvent:
+    name: str
+
+    category: str
+
+    start: float
+
+    duration: float
+
+    thread: int
+
+    nested: bool
+
+    __slots__ = ("name", "category", "start", "duration", "thread", "nested")
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+class StartupProfiler:
+    def __init__(self, events: Iterable[TraceEvent] = ()) -> None:
+        self.__events: List[TraceEvent] = list(events)
+        self.__lock = threading.Lock()
+
+    @property
+    def events(self) -> List[TraceEvent]:
+        with self.__lock:
+            return list(self.__events)
+
+    def record(self, name: str, category: str, start: float, end: float, nested: bool = False) -> None:
+        event = TraceEvent(name, category, start, end - start, threading.get_ident(), nested)
+
+        with self.__lock:
+            self.__events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[None]:
+        start = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.record(name, category, start, perf_counter())
+
+    def totals(self) -> Dict[str, float]:
+        totals: Dict[str, float] = defaultdict(float)
+
+        for event in self.events:
+            if not event.nested:
+                totals[event.category] += event.duration
+
+        return dict(totals)
+
+    @property
+    def elapsed(self) -> float:
+        events = self.events
+
+        if not events:
+            return 0.
+
+        return max(e.end for e in events) - min(e.start for e in events)
+
+    def summary(self) -> str:
+        totals = ", ".join(f"{k}: {v * 1000:.1f} ms" for (k, v) in sorted(self.totals().items()))
+
+        return f"Startup took {self.elapsed * 1000:.1f} ms ({totals})."
+
+    def to_trace(self) -> Dict[str, Any]:
+        events = self.events
+        origin = min((e.start for e in events), default=0.)
+        pid = os.getpid()
+
+        return {
+            "traceEvents": [{
+                "name": e.name,
+                "cat": e.category,
+                "ph": "X",
+                "ts": (e.start - origin) * 1_000_000,
+                "dur": e.duration * 1_000_000,
+                "pid": pid,
+                "tid": e.thread
+            } for e in sorted(events, key=lambda e: e.start)],
+            "displayTimeUnit": "ms"
+        }
+
+    def write(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_trace()))
+
+
+class _ImportTracer(MetaPathFinder):
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self.profiler = profiler
+        self.depth = threading.local()
+
+    def find_spec(self, fullname: str, path: Optional[Sequence[str]], target: Optional[ModuleType] = None) \
+            -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None) if finder is not self else None
+
+            spec = find_spec(fullname, path, target) if find_spec else None
+
+            if spec is None:
+                continue
+
+            loader = spec.loader
+
+            if loader is not None and not isinstance(loader, type) and hasattr(loader, "exec_module"):
+                loader.exec_module = partial(self.__exec_module, fullname, loader, loader.exec_module)
+
+            return spec
+
+        return None
+
+    def __exec_module(self, name: str, loader: Loader, exec_module: Callable[[ModuleType], None],
+                      module: ModuleType) -> None:
+        depth = getattr(self.depth, "value", 0)
+        start = perf_counter()
+
+        self.depth.value = depth + 1
+
+        try:
+            exec_module(module)
+        finally:
+            self.depth.value = depth
+            self.profiler.record(name, "import", start, perf_counter(), depth > 0)
+
+            try:
+                del loader.exec_module
+            except AttributeError:
+                pass
+
+
+_import_tracer: Optional[_ImportTracer] = None
+
+
+def profile_imports() -> StartupProfiler:
+    global _import_tracer
+
+    if _import_tracer is None:
+        _import_tracer = _ImportTracer(StartupProfiler())
+
+        sys.meta_path.insert(0, _import_tracer)
+
+    return _import_tracer.profiler
+
+
+def stop_profiling_imports() -> Optional[StartupProfiler]:
+    global _import_tracer
+
+    tracer = _import_tracer
+
+    if tracer is None:
+        return None
+
+    if tracer in sys.meta_path:
+        sys.meta_path.remove(tracer)
+
+    _import_tracer = None
+
+    return tracer.profiler
+
+
+def describe(callback: Callable) -> str:
+    while isinstance(callback, partial):
+        callback = callback.func
+
+    owner = getattr(callback, "__self__", None)
+    name = getattr(callback, "__name__", None)
+
+    if owner is not None and name and not isinstance(owner, ModuleType):
+        return f"{type(owner).__name__}.{name}"
+
+    return getattr(callback, "__qualname__", None) or repr(callback)
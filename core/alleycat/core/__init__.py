@@ -1,4 +1,18 @@
-from .property import PropertyDescriptor, PropertyHolder, game_property
-from .feature import Feature
-from .bootstrap import Bootstrap
-from .base import BaseProxy, BaseComponent, BaseObject
+from typing import TYPE_CHECKING
+
+from alleycat.common.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".property": ("PropertyDescriptor", "PropertyHolder", "game_property"),
+    ".config": ("load_config", "cache_path_of"),
+    ".feature": ("Feature", "configure_features"),
+    ".bootstrap": ("Bootstrap", "StartProgress"),
+    ".base": ("BaseProxy", "BaseComponent", "BaseObject")
+})
+
+if TYPE_CHECKING:
+    from .property import PropertyDescriptor, PropertyHolder, game_property
+    from .config import load_config, cache_path_of
+    from .feature import Feature, configure_features
+    from .bootstrap import Bootstrap, StartProgress
+    from .base import BaseProxy, BaseComponent, BaseObject
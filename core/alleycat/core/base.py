@@ -9,9 +9,10 @@ from alleycat.core import Bootstrap, PropertyHolder
 
 
 class BaseProxy(PropertyHolder, LoggingSupport, ABC):
+    start_priority: int = 0
 
     def start(self, args: OrderedDict[str, Any]) -> None:
-        Bootstrap.when_ready(partial(super().start, args))
+        Bootstrap.when_ready(partial(super().start, args), self.start_priority)
 
 
 class BaseComponent(BaseProxy, KX_PythonComponent, ABC):
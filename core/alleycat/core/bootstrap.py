@@ -1,31 +1,86 @@
-import json
 import sys
 from collections import OrderedDict
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from itertools import count
 from pathlib import Path
-from typing import Callable, List, cast
+from time import perf_counter
+from typing import Callable, List, Optional, Tuple
 
 from bge.types import KX_GameObject
 from bpy.path import abspath
 from dependency_injector.providers import Configuration
+from reactivex import Observable
+from reactivex.subject import BehaviorSubject
 from validator_collection import not_empty, validators
 
-from alleycat.core import Feature
+from alleycat.common import StartupProfiler, describe, stop_profiling_imports
+from alleycat.core import Feature, cache_path_of, configure_features, load_config
+
+
+@dataclass(frozen=True)
+class StartProgress:
+    started: int
+
+    total: int
+
+    __slots__ = ("started", "total")
+
+    @property
+    def ratio(self) -> float:
+        return self.started / self.total if self.total > 0 else 1.
+
 
 _initialised = False
 
-_on_ready_callbacks: List[Callable[[], None]] = []
+_on_ready_callbacks: List[Tuple[int, int, Callable[[], None]]] = []
+
+_sequence = count()
+
+_started = 0
+
+_on_progress = BehaviorSubject[StartProgress](StartProgress(0, 0))
 
 
 class Bootstrap(KX_GameObject):
     args = OrderedDict((
         ("key", "alleycat"),
         ("config", "//config.json"),
+        ("start_budget", 0.),
+        ("config_cache", True),
+        ("config_workers", 4),
+        ("profile", ""),
     ))
 
+    timer: Callable[[], float] = perf_counter
+
+    __start_budget: float = 0.
+
+    __profiler: Optional[StartupProfiler] = None
+
+    __profile_path: Optional[Path] = None
+
     def start(self, args: OrderedDict) -> None:
+        global _started
+
+        _started = 0
+        _on_progress.on_next(StartProgress(0, len(_on_ready_callbacks)))
+
         key = validators.string(args["key"])
         config_path = validators.string(args["config"])
 
+        self.__start_budget = validators.float(args.get("start_budget", 0.), minimum=0.) / 1000.
+
+        profile_path = validators.string(args.get("profile", ""), allow_empty=True)
+
+        if profile_path:
+            imports = stop_profiling_imports()
+
+            self.__profiler = StartupProfiler(imports.events if imports else ())
+            self.__profile_path = Path(abspath(profile_path))
+
+        profiler = self.__profiler
+
         self.logger.info("Starting %s.", key)
 
         config_file = Path(abspath(config_path))
@@ -33,20 +88,21 @@ class Bootstrap(KX_GameObject):
         print(f"Loading configuration from {config_file}.")
 
         if config_file.exists():
-            with open(config_file) as f:
-                config = Configuration()
-                config.from_dict(json.load(f))
+            cache_file = cache_path_of(config_file) if args.get("config_cache", True) else None
+
+            config = Configuration()
 
-                features = filter(lambda c: isinstance(c, Feature), self.components)
+            started = perf_counter()
 
-                for feature in features:
-                    self.logger.info("Configuring feature %s.", type(feature).__name__)
+            config.from_dict(load_config(config_file, cache_file))
 
-                    # noinspection PyBroadException
-                    try:
-                        cast(Feature, feature).config(config)
-                    except BaseException as e:
-                        self.logger.error("Failed to initialise feature.", exc_info=e)
+            if profiler:
+                profiler.record(config_file.name, "config", started, perf_counter())
+
+            features = filter(lambda c: isinstance(c, Feature), self.components)
+            workers = validators.integer(args.get("config_workers", 4), minimum=1)
+
+            configure_features(features, config, self.logger, workers, profiler)
 
         def except_hook(tpe, value, traceback):
             if tpe != KeyboardInterrupt:
@@ -57,25 +113,70 @@ class Bootstrap(KX_GameObject):
         # noinspection SpellCheckingInspection
         sys.excepthook = except_hook
 
-        for callback in _on_ready_callbacks:
+        if self.__start_budget > 0:
+            self.logger.info("Deferring %d pending starts (budget: %s ms/frame).",
+                             len(_on_ready_callbacks), self.__start_budget * 1000)
+        else:
+            self.__run_callbacks()
+
+    def update(self) -> None:
+        if not _initialised and self.__start_budget > 0:
+            self.__run_callbacks(self.timer() + self.__start_budget)
+
+    def __run_callbacks(self, deadline: Optional[float] = None) -> None:
+        global _initialised, _started
+
+        profiler = self.__profiler
+
+        while _on_ready_callbacks:
+            (_, _, callback) = heappop(_on_ready_callbacks)
+
+            started = perf_counter() if profiler else 0.
+
             try:
                 callback()
             except Exception as e:
                 self.logger.exception(e, exc_info=True)
 
-        global _initialised
+            if profiler:
+                profiler.record(describe(callback), "start", started, perf_counter())
 
-        _initialised = True
+            _started += 1
 
-        _on_ready_callbacks.clear()
+            if deadline is not None and self.timer() >= deadline:
+                break
+
+        _on_progress.on_next(StartProgress(_started, _started + len(_on_ready_callbacks)))
+
+        if _on_ready_callbacks:
+            return
+
+        _initialised = True
 
         self.logger.info("Bootstrap has completed successfully.")
 
+        if profiler:
+            self.__write_profile(profiler)
+
+    def __write_profile(self, profiler: StartupProfiler) -> None:
+        self.__profiler = None
+
+        self.logger.info(profiler.summary())
+
+        try:
+            profiler.write(self.__profile_path)
+        except OSError as e:
+            self.logger.warning("Failed to write the startup profile to %s.", self.__profile_path, exc_info=e)
+
     @staticmethod
-    def when_ready(callback: Callable[[], None]) -> None:
+    def when_ready(callback: Callable[[], None], priority: int = 0) -> None:
         not_empty(callback)
 
         if _initialised:
             callback()
         else:
-            _on_ready_callbacks.append(callback)
+            heappush(_on_ready_callbacks, (-priority, next(_sequence), callback))
+
+    @staticmethod
+    def on_progress() -> Observable[StartProgress]:
+        return _on_progress
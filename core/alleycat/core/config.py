@@ -0,0 +1,86 @@
+import json
+import logging
+import marshal
+from hashlib import blake2b
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from struct import Struct
+from typing import Any, Dict, Final, Optional, Tuple
+
+MAGIC: Final = b"ACCC\x02"
+
+_HEADER: Final = Struct("<5s4sqQ32s")
+
+logger: Final = logging.getLogger(__name__)
+
+
+def _digest(data: bytes) -> bytes:
+    return blake2b(data, digest_size=32).digest()
+
+
+def cache_path_of(config_file: Path) -> Path:
+    return config_file.with_name(config_file.name + ".cache")
+
+
+def load_config(config_file: Path, cache_file: Optional[Path] = None) -> Dict[str, Any]:
+    if cache_file is None:
+        return json.loads(config_file.read_bytes())
+
+    stat = config_file.stat()
+
+    header: Optional[Tuple[bytes, bytes, int, int, bytes]] = None
+    payload = b""
+
+    try:
+        cached = cache_file.read_bytes()
+
+        if len(cached) >= _HEADER.size and cached.startswith(MAGIC):
+            header = _HEADER.unpack_from(cached)
+            payload = cached[_HEADER.size:]
+
+            if header[1] != MAGIC_NUMBER:
+                header = None
+    except OSError:
+        pass
+
+    if header and header[2] == stat.st_mtime_ns and header[3] == stat.st_size:
+        config = _unmarshal(payload, cache_file)
+
+        if config is not None:
+            return config
+
+        header = None
+
+    source = config_file.read_bytes()
+    digest = _digest(source)
+
+    config = _unmarshal(payload, cache_file) if header and header[4] == digest else None
+
+    if config is None:
+        config = json.loads(source)
+        payload = marshal.dumps(config)
+    else:
+        logger.debug("Configuration file was touched but not modified: %s.", config_file)
+
+    _write_cache(cache_file, stat.st_mtime_ns, stat.st_size, digest, payload)
+
+    return config
+
+
+def _unmarshal(payload: bytes, cache_file: Path) -> Optional[Dict[str, Any]]:
+    try:
+        config = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError) as e:
+        logger.warning("Ignoring a corrupt configuration cache %s: %s", cache_file, e)
+        return None
+
+    return config if isinstance(config, dict) else None
+
+
+def _write_cache(cache_file: Path, mtime: int, size: int, digest: bytes, payload: bytes) -> None:
+    try:
+        temp_file = cache_file.with_name(cache_file.name + ".tmp")
+        temp_file.write_bytes(_HEADER.pack(MAGIC, MAGIC_NUMBER, mtime, size, digest) + payload)
+        temp_file.replace(cache_file)
+    except OSError as e:
+        logger.warning("Failed to write configuration cache %s: %s", cache_file, e)
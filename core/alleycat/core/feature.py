@@ -1,15 +1,116 @@
+import logging
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 from bge.types import KX_PythonComponent
 from dependency_injector.providers import Configuration
 
+from alleycat.common import StartupProfiler
+
 
 class Feature(KX_PythonComponent, ABC):
+    dependencies: Tuple[Type["Feature"], ...] = ()
 
     def start(self, args: OrderedDict) -> None:
         pass
 
+    def load(self, config: Configuration) -> None:
+        pass
+
     @abstractmethod
     def config(self, config: Configuration):
         pass
+
+
+def _resolve_dependencies(features: List[Feature], logger: logging.Logger) -> Dict[Feature, Set[Feature]]:
+    graph: Dict[Feature, Set[Feature]] = dict()
+
+    for feature in features:
+        required: Optional[Set[Feature]] = set()
+
+        for dependency in feature.dependencies:
+            candidates = [f for f in features if isinstance(f, dependency) and f is not feature]
+
+            if not candidates:
+                logger.error("Missing dependency %s for feature %s.", dependency.__name__, type(feature).__name__)
+
+                required = None
+                break
+
+            required.update(candidates)
+
+        if required is not None:
+            graph[feature] = required
+
+    while True:
+        invalid = [f for (f, deps) in graph.items() if any(d not in graph for d in deps)]
+
+        if not invalid:
+            return graph
+
+        for feature in invalid:
+            logger.error("Skipping feature %s because one of its dependencies failed.", type(feature).__name__)
+
+            del graph[feature]
+
+
+def configure_features(features: Iterable[Feature],
+                       config: Configuration,
+                       logger: logging.Logger,
+                       max_workers: int = 4,
+                       profiler: Optional[StartupProfiler] = None) -> None:
+    graph = _resolve_dependencies(list(features), logger)
+
+    done: Set[Feature] = set()
+    failed: Set[Feature] = set()
+    running: Dict[Future, Feature] = dict()
+
+    def run(step: Callable[[Configuration], None], feature: Feature, category: str) -> None:
+        if profiler is None:
+            step(config)
+        else:
+            with profiler.span(type(feature).__name__, category):
+                step(config)
+
+    def submit_ready(executor: ThreadPoolExecutor) -> None:
+        for feature in tuple(graph.keys()):
+            deps = graph[feature]
+
+            if deps & failed:
+                logger.error("Skipping feature %s because one of its dependencies failed.", type(feature).__name__)
+
+                failed.add(feature)
+                del graph[feature]
+            elif deps <= done:
+                logger.info("Configuring feature %s.", type(feature).__name__)
+
+                running[executor.submit(run, feature.load, feature, "load")] = feature
+                del graph[feature]
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feature") as executor:
+        submit_ready(executor)
+
+        while running:
+            (completed, _) = wait(tuple(running.keys()), return_when=FIRST_COMPLETED)
+
+            for future in completed:
+                feature = running.pop(future)
+
+                # noinspection PyBroadException
+                try:
+                    future.result()
+
+                    run(feature.config, feature, "config")
+
+                    done.add(feature)
+                except BaseException as e:
+                    logger.error("Failed to initialise feature.", exc_info=e)
+
+                    failed.add(feature)
+
+            submit_ready(executor)
+
+    for feature in graph:
+        logger.error("Skipping feature %s because of a circular dependency.", type(feature).__name__)
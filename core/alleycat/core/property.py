@@ -18,6 +18,8 @@ from alleycat.lifecycle import Startable
 
 T = TypeVar("T")
 
+_NO_VALUES: Final = MapReader(dict())
+
 
 class PropertyHolder(Startable, LoggingSupport, ABC):
     _prop_descriptors: Mapping[str, PropertyDescriptor]
@@ -25,7 +27,21 @@ class PropertyHolder(Startable, LoggingSupport, ABC):
     def __init__(self) -> None:
         super().__init__()
 
-        self.__prop_values = BehaviorSubject[MapReader](MapReader(dict()))
+        self.__values = _NO_VALUES
+        self.__error: Optional[BaseException] = None
+        self.__subject: Optional[BehaviorSubject[MapReader]] = None
+
+    @property
+    def __prop_values(self) -> BehaviorSubject[MapReader]:
+        if self.__subject is None:
+            self.__subject = BehaviorSubject[MapReader](self.__values)
+
+            if self.__error is not None:
+                self.__subject.on_error(self.__error)
+            elif self.is_disposed:
+                self.__subject.dispose()
+
+        return self.__subject
 
     def _do_start(self, args: MapReader) -> ResultE[MapReader]:
         self.logger.debug("Starting with arguments: %s", args)
@@ -34,8 +50,6 @@ class PropertyHolder(Startable, LoggingSupport, ABC):
 
         descriptors = self._prop_descriptors.values()
 
-        self._subscribe_until_dispose(self.__prop_values, on_error=self.logger.error)
-
         def validate(d: PropertyDescriptor, a: MapReader):
             return d.from_args(a, self.logger).map(lambda v: (d.name, v))
 
@@ -47,13 +61,16 @@ class PropertyHolder(Startable, LoggingSupport, ABC):
 
         match start_args.bind(collect):
             case Success(values):
-                self.__prop_values.on_next(values)
+                self.__publish(values)
 
                 self.logger.info("Successfully started with arguments: %s", values)
 
                 return start_args
             case Failure(e):
-                self.__prop_values.on_error(e)
+                self.__error = e
+
+                if self.__subject is not None:
+                    self.__subject.on_error(e)
 
                 self.logger.error("Failed to start with an error: %s", e, exc_info=e)
 
@@ -70,13 +87,26 @@ class PropertyHolder(Startable, LoggingSupport, ABC):
         self._check_started()
         self._check_disposed()
 
-        return self.__prop_values.value
+        return self.__values
 
     def _set_property(self, name: str, value: Any) -> None:
         values = dict(**self._prop_values)
         values[name] = value
 
-        self.__prop_values.on_next(MapReader(values))
+        self.__publish(MapReader(values))
+
+    def _reset(self) -> None:
+        super()._reset()
+
+        self.__values = _NO_VALUES
+        self.__error = None
+        self.__subject = None
+
+    def __publish(self, values: MapReader) -> None:
+        self.__values = values
+
+        if self.__subject is not None:
+            self.__subject.on_next(values)
 
     def __init_subclass__(cls, **kwargs) -> None:
         get_descriptor = partial(getattr, cls)
@@ -94,10 +124,15 @@ class PropertyHolder(Startable, LoggingSupport, ABC):
     def dispose(self) -> None:
         super().dispose()
 
-        if not self.__prop_values.exception:
-            self.__prop_values.on_completed()
+        subject = self.__subject
+
+        if subject is None:
+            return
+
+        if not subject.exception:
+            subject.on_completed()
 
-        self.__prop_values.dispose()
+        subject.dispose()
 
 
 class PropertyDescriptor(Generic[T]):
@@ -1,3 +1,26 @@
-from .event import Event
-from .scheduler import EventLoopScheduler, TimeMode
-from .coroutine import CoroutineRunner
+from typing import TYPE_CHECKING
+
+from alleycat.common.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".event": ("Event",),
+    ".scheduler": ("EventLoopScheduler", "TimeMode", "get_timer"),
+    ".stats": ("TaskStats",),
+    ".profiler": ("TaskProfiler",),
+    ".pool": ("TaskPool",),
+    ".coroutine": ("CoroutineRunner",),
+    ".dispatcher": ("UpdateDispatcher",),
+    ".sharding": ("ShardedUpdateGroup",),
+    ".iterator": ("ObservableIterator", "OverflowPolicy")
+})
+
+if TYPE_CHECKING:
+    from .event import Event
+    from .scheduler import EventLoopScheduler, TimeMode, get_timer
+    from .stats import TaskStats
+    from .profiler import TaskProfiler
+    from .pool import TaskPool
+    from .coroutine import CoroutineRunner
+    from .dispatcher import UpdateDispatcher
+    from .sharding import ShardedUpdateGroup
+    from .iterator import ObservableIterator, OverflowPolicy
@@ -1,28 +1,53 @@
 import logging
-from queue import Queue
-from typing import Callable, Optional
+from queue import Empty, Queue
+from threading import Event
+from time import monotonic
+from typing import Callable, Dict, List, Mapping, Optional, Union
 
 import trio
 from trio import Nursery
 
 from alleycat.common import LoggingSupport
+from alleycat.event import TaskPool, TaskProfiler, TaskStats
 from alleycat.lifecycle import BaseDisposable, Updatable
 
 
 class CoroutineRunner(Updatable, BaseDisposable, LoggingSupport):
     logger: logging.Logger = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
+    def __init__(self,
+                 profile: bool = False,
+                 max_starts_per_update: Optional[int] = None,
+                 shutdown_timeout: float = 0.1) -> None:
         super().__init__()
 
+        if max_starts_per_update is not None and max_starts_per_update < 1:
+            raise ValueError(f"Maximum starts per update must be a positive integer (found: {max_starts_per_update}).")
+
+        if shutdown_timeout < 0:
+            raise ValueError(f"Shutdown timeout must be zero or a positive number (found: {shutdown_timeout}).")
+
         self.__queue = Queue()
         self.__nursery: Optional[Nursery] = None
+        self.__finished = Event()
+
+        self.__max_starts_per_update = max_starts_per_update
+        self.__shutdown_timeout = shutdown_timeout
+
+        self.__pools: Dict[str, TaskPool] = dict()
+        self.__pools_by_priority: List[TaskPool] = []
+
+        def is_user_task(task: trio.lowlevel.Task) -> bool:
+            return self.__nursery is not None and task.parent_nursery is self.__nursery
+
+        self.__profiler = TaskProfiler(is_user_task) if profile else None
 
         def run_sync_soon_threadsafe(fn):
             self.__queue.put(fn, block=False)
 
         def done_callback(trio_main_outcome):
             self.logger.debug("Trio loop ended with: %s.", trio_main_outcome)
+            self.__finished.set()
 
         async def trio_main():
             async with trio.open_nursery() as nursery:
@@ -31,28 +56,101 @@ class CoroutineRunner(Updatable, BaseDisposable, LoggingSupport):
                 while not self.is_disposed:
                     await trio.sleep(0.01)
 
-        self.logger.debug("Starting Trio event loop.")
+        self.logger.debug("Starting Trio event loop (profile: %s).", profile)
 
         trio.lowlevel.start_guest_run(
             trio_main,
             run_sync_soon_threadsafe=run_sync_soon_threadsafe,
-            done_callback=done_callback)
+            done_callback=done_callback,
+            instruments=(self.__profiler,) if self.__profiler else ())
+
+    @property
+    def profiling(self) -> bool:
+        return self.__profiler is not None
+
+    @property
+    def stats(self) -> Mapping[str, TaskStats]:
+        return self.__profiler.stats if self.__profiler else dict()
+
+    def reset_stats(self) -> None:
+        if self.__profiler:
+            self.__profiler.reset()
 
     def run_async(self, task: Callable, *args, name: str = None) -> None:
         self._check_disposed()
 
         self.__nursery.start_soon(task, *args, name=name)
 
+    @property
+    def pools(self) -> Mapping[str, TaskPool]:
+        return self.__pools
+
+    def create_pool(self, name: str, max_concurrency: int, priority: int = 0) -> TaskPool:
+        self._check_disposed()
+
+        if name in self.__pools:
+            raise ValueError(f"Task pool '{name}' already exists.")
+
+        def spawn(task: Callable, task_name: Union[str, Callable]) -> None:
+            self.__nursery.start_soon(task, name=task_name)
+
+        pool = TaskPool(name, max_concurrency, priority, spawn, self._check_disposed)
+
+        self.__pools[name] = pool
+        self.__pools_by_priority = sorted(self.__pools.values(), key=lambda p: p.priority, reverse=True)
+
+        self.logger.debug("Created task pool '%s' (max_concurrency: %d, priority: %d).",
+                          name, max_concurrency, priority)
+
+        return pool
+
     def _do_update(self) -> None:
         self._check_disposed()
 
         super()._do_update()
 
         while not self.__queue.empty():
-            task = self.__queue.get(block=False)
+            self.__execute(self.__queue.get(block=False))
+
+        if self.__nursery and self.__pools_by_priority:
+            self.__dispatch_pools()
+
+    def __dispatch_pools(self) -> None:
+        remaining = self.__max_starts_per_update
+
+        for pool in self.__pools_by_priority:
+            if remaining is None:
+                pool.dispatch()
+            elif remaining > 0:
+                remaining -= pool.dispatch(remaining)
+            else:
+                break
+
+    def __execute(self, task: Callable) -> None:
+        # noinspection PyBroadException
+        try:
+            task()
+        except Exception:
+            self.logger.exception("Failed to execute a coroutine.")
+
+    def dispose(self) -> None:
+        super().dispose()
+
+        self.logger.debug("Stopping Trio event loop.")
+
+        for pool in self.__pools.values():
+            pool.clear()
+
+        if self.__nursery:
+            self.__nursery.cancel_scope.cancel()
+
+        deadline = monotonic() + self.__shutdown_timeout
+
+        while not self.__finished.is_set():
+            remaining = deadline - monotonic()
 
-            # noinspection PyBroadException
             try:
-                task()
-            except Exception:
-                self.logger.exception("Failed to execute a coroutine.")
+                self.__execute(self.__queue.get(timeout=remaining) if remaining > 0 else self.__queue.get_nowait())
+            except Empty:
+                self.logger.warning("Timed out while waiting for Trio event loop to end.")
+                break
@@ -0,0 +1,245 @@
+import logging
+from time import perf_counter
+from typing import Callable, Dict, Mapping, Optional, Tuple, Union
+
+import reactivex
+from reactivex import Observable, operators as ops
+from reactivex.abc import DisposableBase, SchedulerBase
+from reactivex.abc.scheduler import AbsoluteTime, RelativeTime
+from reactivex.disposable import Disposable
+from validator_collection import not_empty
+
+from alleycat.common import LoggingSupport
+from alleycat.event import TaskStats
+from alleycat.lifecycle import BaseDisposable, Updatable
+
+
+class _UpdateEntry:
+    __slots__ = ("updatable", "update", "name", "priority", "sleeping", "alarm", "steps", "total_time", "max_time")
+
+    def __init__(self, updatable: Updatable, name: str, priority: int) -> None:
+        self.updatable = updatable
+        self.update: Callable[[], None] = updatable.update
+        self.name = name
+        self.priority = priority
+        self.sleeping = False
+        self.alarm: Optional[DisposableBase] = None
+        self.steps = 0
+        self.total_time = 0.
+        self.max_time = 0.
+
+
+class UpdateDispatcher(Updatable, BaseDisposable, LoggingSupport):
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, profile: bool = False, scheduler: Optional[SchedulerBase] = None) -> None:
+        super().__init__()
+
+        self.__profile = profile
+        self.__scheduler = scheduler
+
+        self.__entries: Dict[int, _UpdateEntry] = dict()
+
+        self.__active: Dict[int, Dict[int, _UpdateEntry]] = dict()
+        self.__priorities: Tuple[int, ...] = ()
+
+    @property
+    def profiling(self) -> bool:
+        return self.__profile
+
+    @property
+    def stats(self) -> Mapping[str, TaskStats]:
+        if not self.__profile:
+            return dict()
+
+        stats: Dict[str, TaskStats] = dict()
+
+        for entry in self.__entries.values():
+            previous = stats.get(entry.name)
+
+            if previous:
+                stats[entry.name] = TaskStats(
+                    entry.name,
+                    previous.steps + entry.steps,
+                    previous.total_time + entry.total_time,
+                    max(previous.max_time, entry.max_time),
+                    0.)
+            else:
+                stats[entry.name] = TaskStats(entry.name, entry.steps, entry.total_time, entry.max_time, 0.)
+
+        return stats
+
+    def reset_stats(self) -> None:
+        for entry in self.__entries.values():
+            entry.steps = 0
+            entry.total_time = 0.
+            entry.max_time = 0.
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, updatable: Updatable) -> bool:
+        return id(updatable) in self.__entries
+
+    def register(self, updatable: Updatable, priority: int = 0, name: Optional[str] = None) -> DisposableBase:
+        self._check_disposed()
+
+        key = id(not_empty(updatable))
+
+        if key in self.__entries:
+            raise ValueError(f"The object has already been registered: {updatable}.")
+
+        entry = _UpdateEntry(updatable, name if name else type(updatable).__name__, priority)
+
+        if priority not in self.__active:
+            self.__active[priority] = dict()
+
+            self.__priorities = tuple(sorted((*self.__priorities, -priority)))
+
+        self.__entries[key] = entry
+        self.__active[priority][key] = entry
+
+        return Disposable(lambda: self.unregister(updatable))
+
+    def unregister(self, updatable: Updatable) -> bool:
+        key = id(updatable)
+        entry = self.__entries.get(key)
+
+        if entry is None or entry.updatable is not updatable:
+            return False
+
+        del self.__entries[key]
+
+        self.__active[entry.priority].pop(key, None)
+        self.__cancel_alarm(entry)
+
+        entry.sleeping = True
+
+        return True
+
+    @property
+    def active(self) -> int:
+        return sum(map(len, self.__active.values()))
+
+    def sleep(self,
+              updatable: Updatable,
+              until: Optional[Observable] = None,
+              due: Optional[Union[AbsoluteTime, RelativeTime]] = None,
+              scheduler: Optional[SchedulerBase] = None) -> None:
+        entry = self.__entry(updatable)
+
+        if until is not None and due is not None:
+            raise ValueError("Arguments 'until' and 'due' cannot be used together.")
+
+        if due is not None:
+            scheduler = scheduler if scheduler else self.__scheduler
+
+            if scheduler is None:
+                raise ValueError("A scheduler is required to sleep until the given time.")
+
+            until = reactivex.timer(due, scheduler=scheduler)
+
+        self.__cancel_alarm(entry)
+
+        if not entry.sleeping:
+            entry.sleeping = True
+
+            del self.__active[entry.priority][id(updatable)]
+
+        if until is not None:
+            alarm = until.pipe(ops.take(1)).subscribe(on_next=lambda _: self.__wake(entry))
+
+            if entry.sleeping:
+                entry.alarm = alarm
+            else:
+                alarm.dispose()
+
+    def wake(self, updatable: Updatable) -> None:
+        self.__wake(self.__entry(updatable))
+
+    def is_sleeping(self, updatable: Updatable) -> bool:
+        return self.__entry(updatable).sleeping
+
+    def __wake(self, entry: _UpdateEntry) -> None:
+        self.__cancel_alarm(entry)
+
+        key = id(entry.updatable)
+
+        if not entry.sleeping or self.__entries.get(key) is not entry:
+            return
+
+        entry.sleeping = False
+
+        self.__active[entry.priority][key] = entry
+
+    @staticmethod
+    def __cancel_alarm(entry: _UpdateEntry) -> None:
+        alarm = entry.alarm
+
+        if alarm is not None:
+            entry.alarm = None
+            alarm.dispose()
+
+    def __entry(self, updatable: Updatable) -> _UpdateEntry:
+        entry = self.__entries.get(id(updatable))
+
+        if entry is None or entry.updatable is not updatable:
+            raise ValueError(f"The object has not been registered: {updatable}.")
+
+        return entry
+
+    def _do_update(self) -> None:
+        self._check_disposed()
+
+        active = self.__active
+
+        for priority in self.__priorities:
+            entries = active[-priority]
+
+            if not entries:
+                continue
+
+            if self.__profile:
+                self.__update_with_profiler(tuple(entries.values()))
+                continue
+
+            for entry in tuple(entries.values()):
+                if entry.sleeping:
+                    continue
+
+                # noinspection PyBroadException
+                try:
+                    entry.update()
+                except Exception:
+                    self.logger.exception("Failed to update '%s'.", entry.name)
+
+    def __update_with_profiler(self, entries: Tuple[_UpdateEntry, ...]) -> None:
+        for entry in entries:
+            if entry.sleeping:
+                continue
+
+            started = perf_counter()
+
+            # noinspection PyBroadException
+            try:
+                entry.update()
+            except Exception:
+                self.logger.exception("Failed to update '%s'.", entry.name)
+
+            elapsed = perf_counter() - started
+
+            entry.steps += 1
+            entry.total_time += elapsed
+
+            if elapsed > entry.max_time:
+                entry.max_time = elapsed
+
+    def dispose(self) -> None:
+        super().dispose()
+
+        for entry in self.__entries.values():
+            self.__cancel_alarm(entry)
+
+        self.__entries.clear()
+        self.__active.clear()
+        self.__priorities = ()
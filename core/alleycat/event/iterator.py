@@ -0,0 +1,85 @@
+from enum import Enum
+from typing import AsyncIterator, Final, Optional, TypeVar
+
+import trio
+from reactivex import Observable
+from validator_collection import not_empty
+
+from alleycat.lifecycle import BaseDisposable
+
+T = TypeVar("T")
+
+
+class OverflowPolicy(Enum):
+    DropOldest = 0
+    DropNewest = 1
+    Latest = 2
+
+
+class ObservableIterator(AsyncIterator[T], BaseDisposable):
+    buffer_size: Final[int]
+
+    policy: Final[OverflowPolicy]
+
+    def __init__(self,
+                 source: Observable[T],
+                 buffer_size: int = 1,
+                 policy: OverflowPolicy = OverflowPolicy.Latest) -> None:
+        super().__init__()
+
+        if buffer_size < 1:
+            raise ValueError(f"Buffer size must be a positive integer (found: {buffer_size}).")
+
+        self.buffer_size = buffer_size
+        self.policy = not_empty(policy)
+
+        self.__sender, self.__receiver = trio.open_memory_channel[T](buffer_size)
+        self.__error: Optional[Exception] = None
+
+        self._subscribe_until_dispose(
+            not_empty(source),
+            on_next=self.__on_next,
+            on_error=self.__on_error,
+            on_completed=self.__sender.close)
+
+    def __on_next(self, value: T) -> None:
+        try:
+            self.__sender.send_nowait(value)
+        except trio.WouldBlock:
+            match self.policy:
+                case OverflowPolicy.DropNewest:
+                    return
+                case OverflowPolicy.DropOldest:
+                    self.__receiver.receive_nowait()
+                case OverflowPolicy.Latest:
+                    self.__drain()
+
+            self.__sender.send_nowait(value)
+        except (trio.ClosedResourceError, trio.BrokenResourceError):
+            pass
+
+    def __on_error(self, error: Exception) -> None:
+        self.__error = error
+        self.__sender.close()
+
+    def __drain(self) -> None:
+        try:
+            while True:
+                self.__receiver.receive_nowait()
+        except trio.WouldBlock:
+            pass
+
+    async def __anext__(self) -> T:
+        try:
+            return await self.__receiver.receive()
+        except (trio.EndOfChannel, trio.ClosedResourceError):
+            if self.__error is not None:
+                raise self.__error
+
+            raise StopAsyncIteration
+
+    def dispose(self) -> None:
+        super().dispose()
+
+        self.__sender.close()
+        self.__receiver.close()
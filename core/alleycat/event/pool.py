@@ -0,0 +1,82 @@
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Final, Optional, Tuple, Union
+
+from validator_collection import not_empty
+
+from alleycat.common import LoggingSupport
+
+Spawner = Callable[[Callable, Union[str, Callable]], None]
+
+
+class TaskPool(LoggingSupport):
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    name: Final[str]
+
+    max_concurrency: Final[int]
+
+    priority: Final[int]
+
+    def __init__(self,
+                 name: str,
+                 max_concurrency: int,
+                 priority: int,
+                 spawner: Spawner,
+                 check_disposed: Callable[[], None]) -> None:
+        super().__init__()
+
+        if max_concurrency < 1:
+            raise ValueError(f"Maximum concurrency must be a positive integer (found: {max_concurrency}).")
+
+        self.name = not_empty(name)
+        self.max_concurrency = max_concurrency
+        self.priority = priority
+
+        self.__spawner = not_empty(spawner)
+        self.__check_disposed = not_empty(check_disposed)
+
+        self.__pending: Deque[Tuple[Callable, Tuple[Any, ...], Optional[str]]] = deque()
+        self.__running = 0
+
+    @property
+    def running(self) -> int:
+        return self.__running
+
+    @property
+    def pending(self) -> int:
+        return len(self.__pending)
+
+    def run_async(self, task: Callable, *args, name: str = None) -> None:
+        self.__check_disposed()
+
+        self.__pending.append((not_empty(task), args, name))
+
+    def clear(self) -> None:
+        self.__pending.clear()
+
+    def dispatch(self, limit: Optional[int] = None) -> int:
+        count = min(self.max_concurrency - self.__running, len(self.__pending))
+
+        if limit is not None:
+            count = min(count, limit)
+
+        for _ in range(count):
+            (task, args, name) = self.__pending.popleft()
+
+            self.__running += 1
+            self.__spawner(self.__wrap(task, args), name if name else task)
+
+        return max(count, 0)
+
+    def __wrap(self, task: Callable, args: Tuple[Any, ...]) -> Callable:
+        async def run():
+            # noinspection PyBroadException
+            try:
+                await task(*args)
+            except Exception:
+                self.logger.exception("Failed to execute a task in pool '%s'.", self.name)
+            finally:
+                self.__running -= 1
+
+        return run
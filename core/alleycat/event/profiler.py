@@ -0,0 +1,82 @@
+from time import perf_counter
+from typing import Callable, Dict, Mapping, Set
+
+from trio.abc import Instrument
+from trio.lowlevel import Task
+
+from alleycat.event import TaskStats
+
+
+class _TaskRecord:
+    __slots__ = ("steps", "total_time", "max_time", "wait_time")
+
+    def __init__(self) -> None:
+        self.steps = 0
+        self.total_time = 0.
+        self.max_time = 0.
+        self.wait_time = 0.
+
+
+class TaskProfiler(Instrument):
+
+    def __init__(self, accept: Callable[[Task], bool] = lambda _: True) -> None:
+        super().__init__()
+
+        self.__accept = accept
+
+        self.__records: Dict[str, _TaskRecord] = dict()
+
+        self.__step_started: Dict[Task, float] = dict()
+        self.__step_ended: Dict[Task, float] = dict()
+
+        self.__exited: Set[Task] = set()
+
+    @property
+    def stats(self) -> Mapping[str, TaskStats]:
+        return {k: TaskStats(k, v.steps, v.total_time, v.max_time, v.wait_time) for k, v in self.__records.items()}
+
+    def reset(self) -> None:
+        self.__records.clear()
+
+    def before_task_step(self, task: Task) -> None:
+        if not self.__accept(task):
+            return
+
+        now = perf_counter()
+
+        self.__step_started[task] = now
+
+        if task in self.__step_ended:
+            record = self.__records.get(task.name)
+
+            if record:
+                record.wait_time += now - self.__step_ended[task]
+
+    def after_task_step(self, task: Task) -> None:
+        started = self.__step_started.pop(task, None)
+
+        if started is None:
+            return
+
+        now = perf_counter()
+        elapsed = now - started
+
+        record = self.__records.get(task.name)
+
+        if record is None:
+            record = _TaskRecord()
+            self.__records[task.name] = record
+
+        record.steps += 1
+        record.total_time += elapsed
+        record.max_time = max(record.max_time, elapsed)
+
+        if task in self.__exited:
+            self.__exited.remove(task)
+            self.__step_ended.pop(task, None)
+        else:
+            self.__step_ended[task] = now
+
+    def task_exited(self, task: Task) -> None:
+        if task in self.__step_started:
+            self.__exited.add(task)
@@ -3,7 +3,7 @@ from enum import Enum
 from logging import Logger, getLogger
 from queue import PriorityQueue
 from time import mktime
-from typing import Final, Optional, TypeVar
+from typing import Callable, Final, Optional, TypeVar
 
 import bge
 from reactivex import Observable
@@ -25,6 +25,17 @@ class TimeMode(Enum):
     Real = 2
 
 
+def get_timer(mode: TimeMode) -> Callable[[], float]:
+    if mode == TimeMode.Frame:
+        return bge.logic.getFrameTime
+    elif mode == TimeMode.Clock:
+        return bge.logic.getClockTime
+    elif mode == TimeMode.Real:
+        return bge.logic.getRealTime
+    else:
+        assert False
+
+
 class EventLoopScheduler(Disposable, PeriodicScheduler):
     logger: Final[Logger]
 
@@ -36,19 +47,16 @@ class EventLoopScheduler(Disposable, PeriodicScheduler):
         self.__queue: PriorityQueue[ScheduledItem] = PriorityQueue()
         self.__init_time = mktime((init_time if init_time else datetime.now()).timetuple())
 
-        if mode == TimeMode.Frame:
-            self.__timer = bge.logic.getFrameTime
-        elif mode == TimeMode.Clock:
-            self.__timer = bge.logic.getClockTime
-        elif mode == TimeMode.Real:
-            self.__timer = bge.logic.getRealTime
-        else:
-            assert False
+        self.__timer = get_timer(mode)
 
         self.logger.info("Creating a scheduler with timer: %s (init_time: %s).", mode.name, self.__init_time)
 
         self.__on_process = Subject[datetime]()
 
+    @property
+    def timer(self) -> Callable[[], float]:
+        return self.__timer
+
     @property
     def now(self) -> datetime:
         return datetime.fromtimestamp(self.__init_time + self.__timer())
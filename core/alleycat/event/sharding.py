@@ -0,0 +1,125 @@
+import logging
+from typing import Callable, Dict, Final, List
+
+from reactivex.abc import DisposableBase
+from reactivex.disposable import Disposable
+from validator_collection import not_empty
+
+from alleycat.common import LoggingSupport
+from alleycat.event import TimeMode, get_timer
+from alleycat.lifecycle import BaseDisposable, TimedUpdatable, Updatable
+
+
+class _ShardEntry:
+    __slots__ = ("member", "update", "timed", "index", "last_time")
+
+    def __init__(self, member: Updatable, index: int, last_time: float) -> None:
+        self.member = member
+        self.timed = isinstance(member, TimedUpdatable)
+        self.update: Callable = member.update_elapsed if self.timed else member.update
+        self.index = index
+        self.last_time = last_time
+
+
+class ShardedUpdateGroup(Updatable, BaseDisposable, LoggingSupport):
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    shards: Final[int]
+
+    def __init__(self, shards: int, mode: TimeMode = TimeMode.Frame) -> None:
+        super().__init__()
+
+        if shards < 1:
+            raise ValueError(f"Number of shards must be a positive integer (found: {shards}).")
+
+        self.shards = shards
+
+        self.__timer = get_timer(mode)
+
+        self.__entries: List[_ShardEntry] = []
+        self.__indices: Dict[int, _ShardEntry] = dict()
+
+        self.__tick = 0
+
+    @property
+    def current_shard(self) -> int:
+        return self.__tick
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, member: Updatable) -> bool:
+        return id(member) in self.__indices
+
+    def shard_of(self, member: Updatable) -> int:
+        entry = self.__indices.get(id(member))
+
+        if entry is None or entry.member is not member:
+            raise ValueError(f"The object is not a member of the group: {member}.")
+
+        return entry.index % self.shards
+
+    def add(self, member: Updatable) -> DisposableBase:
+        self._check_disposed()
+
+        key = id(not_empty(member))
+
+        if key in self.__indices:
+            raise ValueError(f"The object is already a member of the group: {member}.")
+
+        entry = _ShardEntry(member, len(self.__entries), self.__timer())
+
+        self.__entries.append(entry)
+        self.__indices[key] = entry
+
+        return Disposable(lambda: self.remove(member))
+
+    def remove(self, member: Updatable) -> bool:
+        entry = self.__indices.get(id(member))
+
+        if entry is None or entry.member is not member:
+            return False
+
+        del self.__indices[id(member)]
+
+        last = self.__entries.pop()
+
+        if last is not entry:
+            last.index = entry.index
+            self.__entries[entry.index] = last
+
+        entry.index = -1
+
+        return True
+
+    def _do_update(self) -> None:
+        self._check_disposed()
+
+        shard = self.__tick
+
+        self.__tick = (shard + 1) % self.shards
+
+        now = self.__timer()
+
+        for entry in self.__entries[shard::self.shards]:
+            if entry.index < 0:
+                continue
+
+            elapsed = now - entry.last_time
+
+            entry.last_time = now
+
+            # noinspection PyBroadException
+            try:
+                if entry.timed:
+                    entry.update(elapsed)
+                else:
+                    entry.update()
+            except Exception:
+                self.logger.exception("Failed to update a member of the group: %s.", entry.member)
+
+    def dispose(self) -> None:
+        super().dispose()
+
+        self.__entries.clear()
+        self.__indices.clear()
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TaskStats:
+    name: str
+
+    steps: int
+
+    total_time: float
+
+    max_time: float
+
+    wait_time: float
+
+    __slots__ = ("name", "steps", "total_time", "max_time", "wait_time")
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.steps if self.steps > 0 else 0.
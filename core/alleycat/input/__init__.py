@@ -1,3 +1,24 @@
-from .event import InputEvent
-from .mouse import MouseState, MouseButton, MouseInputSource, MouseEvent, MouseButtonEvent, MouseUpEvent, \
-    MouseDownEvent, MouseMoveEvent
+from typing import TYPE_CHECKING
+
+from alleycat.common.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".event": ("InputEvent",),
+    ".mouse": ("MouseState", "MouseButton", "MouseInputSource", "MouseEvent", "MouseButtonEvent", "MouseUpEvent",
+               "MouseDownEvent", "MouseMoveEvent"),
+    ".keyboard": ("KeyboardState", "KeyboardInputSource", "KeyboardEvent", "KeyEvent", "KeyDownEvent", "KeyUpEvent"),
+    ".recording": ("InputRecord", "InputRecorder", "RecordType", "read_records", "load_records"),
+    ".action": ("ActionState", "ActionMap", "ActionInputSource"),
+    ".joystick": ("JoystickState", "JoystickInputSource", "JoystickEvent", "JoystickButtonEvent",
+                  "JoystickButtonDownEvent", "JoystickButtonUpEvent")
+})
+
+if TYPE_CHECKING:
+    from .event import InputEvent
+    from .mouse import MouseState, MouseButton, MouseInputSource, MouseEvent, MouseButtonEvent, MouseUpEvent, \
+        MouseDownEvent, MouseMoveEvent
+    from .keyboard import KeyboardState, KeyboardInputSource, KeyboardEvent, KeyEvent, KeyDownEvent, KeyUpEvent
+    from .recording import InputRecord, InputRecorder, RecordType, read_records, load_records
+    from .action import ActionState, ActionMap, ActionInputSource
+    from .joystick import JoystickState, JoystickInputSource, JoystickEvent, JoystickButtonEvent, \
+        JoystickButtonDownEvent, JoystickButtonUpEvent
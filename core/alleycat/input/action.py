@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Final, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import bge
+from dependency_injector.providers import Configuration
+from returns.result import Result, ResultE
+from validator_collection import not_empty
+
+from alleycat.input import KeyboardInputSource, KeyboardState, MouseButton, MouseInputSource, MouseState
+from alleycat.state import StateManager
+
+_AXES: Final = ("x", "y")
+
+
+@dataclass(frozen=True)
+class ActionState:
+    indices: Mapping[str, int]
+
+    values: Tuple[float, ...]
+
+    __slots__ = ("indices", "values")
+
+    def value(self, action: str) -> float:
+        return self.values[self.indices[action]]
+
+    def pressed(self, action: str) -> bool:
+        return self.values[self.indices[action]] != 0
+
+    def __getitem__(self, action: str) -> float:
+        return self.value(action)
+
+
+class ActionMap:
+    names: Final[Tuple[str, ...]]
+
+    indices: Final[Mapping[str, int]]
+
+    __slots__ = ("names", "indices", "__buttons", "__axes")
+
+    def __init__(self,
+                 names: Sequence[str],
+                 buttons: Iterable[Tuple[int, int, int, float]] = (),
+                 axes: Iterable[Tuple[int, int, float]] = ()) -> None:
+        self.names = tuple(names)
+        self.indices = dict((n, i) for (i, n) in enumerate(self.names))
+
+        self.__buttons = tuple(buttons)
+        self.__axes = tuple(axes)
+
+    def evaluate(self, button_mask: int, key_mask: int, dx: float, dy: float) -> Tuple[float, ...]:
+        values = [0.] * len(self.names)
+
+        for (index, buttons, keys, scale) in self.__buttons:
+            if button_mask & buttons or key_mask & keys:
+                values[index] += scale
+
+        for (index, axis, scale) in self.__axes:
+            values[index] += (dy if axis else dx) * scale
+
+        return tuple(values)
+
+    @staticmethod
+    def compile(bindings: Mapping[str, Sequence[Mapping[str, Any]]]) -> ActionMap:
+        names = tuple(bindings.keys())
+
+        groups: Dict[Tuple[int, float], List[int]] = dict()
+        axes: List[Tuple[int, int, float]] = []
+
+        for (index, name) in enumerate(names):
+            for binding in bindings[name]:
+                scale = float(binding.get("scale", 1.0))
+
+                if "mouse" in binding:
+                    button = MouseButton.__members__.get(binding["mouse"])
+
+                    if button is None:
+                        raise ValueError(f"Unknown mouse button '{binding['mouse']}' for action '{name}'.")
+
+                    group = groups.setdefault((index, scale), [0, 0])
+                    group[0] |= button.mask
+                elif "key" in binding:
+                    key = getattr(bge.events, binding["key"], None)
+
+                    if not isinstance(key, int):
+                        raise ValueError(f"Unknown key '{binding['key']}' for action '{name}'.")
+
+                    group = groups.setdefault((index, scale), [0, 0])
+                    group[1] |= 1 << key
+                elif "axis" in binding:
+                    if binding["axis"] not in _AXES:
+                        raise ValueError(f"Unknown axis '{binding['axis']}' for action '{name}'.")
+
+                    axes.append((index, _AXES.index(binding["axis"]), scale))
+                else:
+                    raise ValueError(f"Invalid binding for action '{name}': {binding}.")
+
+        buttons = ((i, m, k, s) for ((i, s), (m, k)) in groups.items())
+
+        return ActionMap(names, buttons, axes)
+
+    @staticmethod
+    def from_config(config: Configuration, key: str = "input.actions") -> ActionMap:
+        return ActionMap.compile(not_empty(config).get(key) or dict())
+
+
+class ActionInputSource(StateManager[ActionState]):
+    actions: Final[ActionMap]
+
+    def __init__(self,
+                 actions: ActionMap,
+                 mouse: Optional[MouseInputSource] = None,
+                 keyboard: Optional[KeyboardInputSource] = None) -> None:
+        super().__init__()
+
+        self.actions = not_empty(actions)
+
+        self.__mouse = mouse
+        self.__keyboard = keyboard
+
+        self.__last_mouse: Optional[MouseState] = None
+        self.__last_keyboard: Optional[KeyboardState] = None
+
+        self.__moving = False
+
+    def _reset(self) -> None:
+        super()._reset()
+
+        self.__last_mouse = None
+        self.__last_keyboard = None
+
+        self.__moving = False
+
+    @property
+    def init_state(self) -> ResultE[ActionState]:
+        return Result.from_value(ActionState(self.actions.indices, (0.,) * len(self.actions.names)))
+
+    def next_state(self, state: ActionState) -> ResultE[ActionState]:
+        mouse = self.__mouse.state.value_or(None) if self.__mouse else None
+        keyboard = self.__keyboard.state.value_or(None) if self.__keyboard else None
+
+        last_mouse = self.__last_mouse
+
+        if mouse is last_mouse and keyboard is self.__last_keyboard and not self.__moving:
+            return self.state
+
+        self.__last_mouse = mouse
+        self.__last_keyboard = keyboard
+
+        button_mask = mouse.button_mask if mouse else 0
+        key_mask = keyboard.key_mask if keyboard else 0
+
+        if mouse and last_mouse:
+            (dx, dy) = (mouse.position.x - last_mouse.position.x, mouse.position.y - last_mouse.position.y)
+        else:
+            (dx, dy) = (0., 0.)
+
+        self.__moving = dx != 0 or dy != 0
+
+        values = self.actions.evaluate(button_mask, key_mask, dx, dy)
+
+        if values == state.values:
+            return self.state
+
+        return Result.from_value(ActionState(self.actions.indices, values))
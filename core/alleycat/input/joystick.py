@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from abc import ABC
+from array import array
+from dataclasses import dataclass
+from math import hypot
+from typing import Final, Tuple
+
+import bge
+from reactivex import Observable, Subject
+from returns.result import Result, ResultE
+
+from alleycat.core import BaseComponent, game_property
+from alleycat.input import InputEvent
+from alleycat.state import StateManager
+
+MAX_JOYSTICKS: Final = 8
+
+MAX_AXES: Final = 8
+
+_NO_AXES: Final = array("d", (0.,) * MAX_AXES)
+
+
+@dataclass(frozen=True)
+class JoystickState:
+    connected: int
+
+    axes: Tuple[float, ...]
+
+    buttons: Tuple[int, ...]
+
+    __slots__ = ("connected", "axes", "buttons")
+
+    def is_connected(self, device: int) -> bool:
+        return bool(self.connected >> device & 1)
+
+    def axis(self, device: int, index: int) -> float:
+        return self.axes[device * MAX_AXES + index]
+
+    def pressed(self, device: int, button: int) -> bool:
+        return bool(self.buttons[device] >> button & 1)
+
+
+class JoystickInputSource(BaseComponent, StateManager[JoystickState]):
+    dead_zone: float = game_property(0.1)
+
+    response_curve: float = game_property(1.0)
+
+    threshold: float = game_property(0.01)
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.__setup()
+
+    def _reset(self) -> None:
+        super()._reset()
+
+        self.__setup()
+
+    def __setup(self) -> None:
+        self.__values = _NO_AXES * MAX_JOYSTICKS
+        self.__emitted = array("d", self.__values)
+
+        self.__buttons = [0] * MAX_JOYSTICKS
+
+        self.__on_button_down = Subject[JoystickButtonEvent]()
+        self.__on_button_up = Subject[JoystickButtonEvent]()
+
+        self.__last_state = JoystickState(0, tuple(self.__values), tuple(self.__buttons))
+
+        self._subscribe_until_dispose(
+            self.on_state_change,
+            on_next=self.__dispatch,
+            on_completed=self.__complete)
+
+    @property
+    def init_state(self) -> ResultE[JoystickState]:
+        if not 0. <= self.dead_zone < 1.:
+            return Result.from_failure(
+                ValueError(f"Dead zone must be in the range [0, 1) (found: {self.dead_zone})."))
+
+        if self.response_curve <= 0.:
+            return Result.from_failure(
+                ValueError(f"Response curve must be a positive number (found: {self.response_curve})."))
+
+        return Result.from_value(self.__last_state)
+
+    def next_state(self, state: JoystickState) -> ResultE[JoystickState]:
+        dead_zone = self.dead_zone
+        scale = 1. / (1. - dead_zone)
+        exponent = self.response_curve
+        threshold = self.threshold
+
+        values = self.__values
+        emitted = self.__emitted
+        buttons = self.__buttons
+
+        connected = 0
+        changed = False
+
+        for (device, joystick) in enumerate(bge.logic.joysticks[:MAX_JOYSTICKS]):
+            offset = device * MAX_AXES
+
+            if joystick is None:
+                if state.connected >> device & 1:
+                    values[offset:offset + MAX_AXES] = _NO_AXES
+                    buttons[device] = 0
+
+                continue
+
+            connected |= 1 << device
+
+            axes = joystick.axisValues[:MAX_AXES]
+            count = len(axes)
+
+            for axis in range(0, count, 2):
+                x = axes[axis]
+                y = axes[axis + 1] if axis + 1 < count else 0.
+
+                magnitude = hypot(x, y)
+
+                if magnitude <= dead_zone:
+                    factor = 0.
+                else:
+                    factor = min(((magnitude - dead_zone) * scale) ** exponent, 1.) / magnitude
+
+                i = offset + axis
+
+                values[i] = x * factor
+
+                if axis + 1 < count:
+                    values[i + 1] = y * factor
+
+                if not changed and (abs(values[i] - emitted[i]) > threshold or
+                                    abs(values[i + 1] - emitted[i + 1]) > threshold):
+                    changed = True
+
+            mask = 0
+
+            for button in joystick.activeButtons:
+                mask |= 1 << button
+
+            if mask != state.buttons[device]:
+                buttons[device] = mask
+                changed = True
+
+        if not changed and connected == state.connected:
+            return self.state
+
+        emitted[:] = values
+
+        return Result.from_value(JoystickState(connected, tuple(values), tuple(buttons)))
+
+    def __dispatch(self, state: JoystickState) -> None:
+        last_state = self.__last_state
+
+        self.__last_state = state
+
+        for device in range(MAX_JOYSTICKS):
+            last_mask = last_state.buttons[device]
+            mask = state.buttons[device]
+
+            changed = last_mask ^ mask
+
+            if changed == 0:
+                continue
+
+            for button in range(changed.bit_length()):
+                if not changed >> button & 1:
+                    continue
+
+                if mask >> button & 1:
+                    self.__on_button_down.on_next(JoystickButtonDownEvent(self, state, device, button))
+                else:
+                    self.__on_button_up.on_next(JoystickButtonUpEvent(self, state, device, button))
+
+    def __complete(self) -> None:
+        for subject in (self.__on_button_down, self.__on_button_up):
+            subject.on_completed()
+            subject.dispose()
+
+    @property
+    def on_button_down(self) -> Observable[JoystickButtonEvent]:
+        return self.__on_button_down
+
+    @property
+    def on_button_up(self) -> Observable[JoystickButtonEvent]:
+        return self.__on_button_up
+
+
+@dataclass(frozen=True)
+class JoystickEvent(InputEvent[JoystickInputSource], ABC):
+    state: JoystickState
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        if self.state is None:
+            raise ValueError("Argument 'state' is required.")
+
+
+@dataclass(frozen=True)
+class JoystickButtonEvent(JoystickEvent, ABC):
+    device: int
+
+    button: int
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        if self.device is None:
+            raise ValueError("Argument 'device' is required.")
+
+        if self.button is None:
+            raise ValueError("Argument 'button' is required.")
+
+
+class JoystickButtonDownEvent(JoystickButtonEvent):
+    pass
+
+
+class JoystickButtonUpEvent(JoystickButtonEvent):
+    pass
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from abc import ABC
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Iterator
+
+from bge.logic import KX_INPUT_ACTIVE, keyboard
+from reactivex import Observable, Subject
+from returns.result import Result, ResultE
+
+from alleycat.core import BaseComponent
+from alleycat.input import InputEvent
+from alleycat.state import StateManager
+
+
+def iterate_keys(key_mask: int) -> Iterator[int]:
+    while key_mask:
+        bit = key_mask & -key_mask
+
+        yield bit.bit_length() - 1
+
+        key_mask ^= bit
+
+
+@dataclass(frozen=True)
+class KeyboardState:
+    key_mask: int
+
+    __slots__ = ("key_mask",)
+
+    @property
+    def keys(self) -> FrozenSet[int]:
+        return frozenset(iterate_keys(self.key_mask))
+
+    def pressed(self, key: int) -> bool:
+        return bool(self.key_mask >> key & 1)
+
+    @staticmethod
+    def from_keys(keys: Iterable[int]) -> KeyboardState:
+        mask = 0
+
+        for key in keys:
+            mask |= 1 << key
+
+        return KeyboardState(mask)
+
+
+class KeyboardInputSource(BaseComponent, StateManager[KeyboardState]):
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.__setup()
+
+    def _reset(self) -> None:
+        super()._reset()
+
+        self.__setup()
+
+    def __setup(self) -> None:
+        self.__last_mask = 0
+
+        self.__on_key_down = Subject[KeyDownEvent]()
+        self.__on_key_up = Subject[KeyUpEvent]()
+
+        self.__on_key_press: Dict[int, Subject[KeyDownEvent]] = dict()
+        self.__on_key_release: Dict[int, Subject[KeyUpEvent]] = dict()
+
+        self._subscribe_until_dispose(
+            self.on_state_change,
+            on_next=self.__dispatch,
+            on_completed=self.__complete)
+
+    @property
+    def init_state(self) -> ResultE[KeyboardState]:
+        return Result.from_value(KeyboardState(0))
+
+    def next_state(self, state: KeyboardState) -> ResultE[KeyboardState]:
+        mask = 0
+
+        for (key, value) in keyboard.activeInputs.items():
+            if KX_INPUT_ACTIVE in value.status:
+                mask |= 1 << key
+
+        if mask == state.key_mask:
+            return self.state
+
+        return Result.from_value(KeyboardState(mask))
+
+    def __dispatch(self, state: KeyboardState) -> None:
+        last_mask = self.__last_mask
+        mask = state.key_mask
+
+        self.__last_mask = mask
+
+        changed = last_mask ^ mask
+
+        if changed == 0:
+            return
+
+        for key in iterate_keys(changed & mask):
+            event = KeyDownEvent(self, state, key)
+
+            self.__on_key_down.on_next(event)
+
+            if key in self.__on_key_press:
+                self.__on_key_press[key].on_next(event)
+
+        for key in iterate_keys(changed & last_mask):
+            event = KeyUpEvent(self, state, key)
+
+            self.__on_key_up.on_next(event)
+
+            if key in self.__on_key_release:
+                self.__on_key_release[key].on_next(event)
+
+    def __complete(self) -> None:
+        subjects = (self.__on_key_down, self.__on_key_up, *self.__on_key_press.values(),
+                    *self.__on_key_release.values())
+
+        for subject in subjects:
+            subject.on_completed()
+            subject.dispose()
+
+    @property
+    def on_key_down(self) -> Observable[KeyDownEvent]:
+        return self.__on_key_down
+
+    @property
+    def on_key_up(self) -> Observable[KeyUpEvent]:
+        return self.__on_key_up
+
+    def on_key_press(self, key: int) -> Observable[KeyDownEvent]:
+        self._check_disposed()
+
+        if key not in self.__on_key_press:
+            self.__on_key_press[key] = Subject[KeyDownEvent]()
+
+        return self.__on_key_press[key]
+
+    def on_key_release(self, key: int) -> Observable[KeyUpEvent]:
+        self._check_disposed()
+
+        if key not in self.__on_key_release:
+            self.__on_key_release[key] = Subject[KeyUpEvent]()
+
+        return self.__on_key_release[key]
+
+
+@dataclass(frozen=True)
+class KeyboardEvent(InputEvent[KeyboardInputSource], ABC):
+    state: KeyboardState
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        if self.state is None:
+            raise ValueError("Argument 'state' is required.")
+
+
+@dataclass(frozen=True)
+class KeyEvent(KeyboardEvent, ABC):
+    key: int
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        if self.key is None:
+            raise ValueError("Argument 'key' is required.")
+
+
+class KeyDownEvent(KeyEvent):
+    pass
+
+
+class KeyUpEvent(KeyEvent):
+    pass
@@ -3,12 +3,12 @@ from __future__ import annotations
 from abc import ABC
 from dataclasses import dataclass
 from enum import Enum
-from functools import partial
-from typing import Set
+from typing import Final, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 from bge.events import LEFTMOUSE, MIDDLEMOUSE, RIGHTMOUSE
-from bge.logic import KX_INPUT_ACTIVE, mouse
-from reactivex import Observable, operators as ops
+from bge.logic import KX_INPUT_ACTIVE, KX_INPUT_JUST_ACTIVATED, KX_INPUT_JUST_RELEASED, mouse
+from bge.types import SCA_InputEvent
+from reactivex import Observable, Subject, defer, operators as ops
 from returns.result import Result, ResultE
 
 from alleycat.common import Point2D
@@ -33,53 +33,185 @@ class MouseButton(Enum):
         else:
             assert False
 
+    @property
+    def mask(self) -> int:
+        return 1 << self.value
+
+
+_BUTTONS: Final = tuple(MouseButton)
+
+_BUTTON_INPUTS: Final = tuple((b.event, b.mask) for b in _BUTTONS)
+
+_BUTTON_SETS: Final = tuple(frozenset(b for b in _BUTTONS if m & b.mask) for m in range(1 << len(_BUTTONS)))
+
+_NO_OFFSET: Final = Point2D(0, 0)
+
 
 @dataclass(frozen=True)
 class MouseState:
     position: Point2D
 
-    buttons: Set[MouseButton]
+    button_mask: int
 
-    __slots__ = ("position", "buttons")
+    __slots__ = ("position", "button_mask")
+
+    @property
+    def buttons(self) -> FrozenSet[MouseButton]:
+        return _BUTTON_SETS[self.button_mask]
+
+    @staticmethod
+    def from_buttons(position: Point2D, buttons: Iterable[MouseButton]) -> MouseState:
+        mask = 0
+
+        for button in buttons:
+            mask |= button.mask
+
+        return MouseState(position, mask)
 
 
 class MouseInputSource(BaseComponent, StateManager[MouseState]):
+    use_event_queue: bool = False
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.__setup()
+
+    def _reset(self) -> None:
+        super()._reset()
+
+        self.__setup()
+
+    def __setup(self) -> None:
+        self.__last_state: Optional[MouseState] = None
+        self.__transitions: List[Tuple[MouseButton, bool]] = []
+
+        self.__last_move: Optional[MouseMoveEvent] = None
+
+        self.__on_mouse_move = Subject[MouseMoveEvent]()
+        self.__on_mouse_move_replay = defer(self.__replay_last_move)
+        self.__on_mouse_down = Subject[MouseButtonEvent]()
+        self.__on_mouse_up = Subject[MouseButtonEvent]()
+
+        self._subscribe_until_dispose(
+            self.on_state_change,
+            on_next=self.__dispatch,
+            on_completed=self.__complete)
 
     @property
     def init_state(self) -> ResultE[MouseState]:
-        return Result.from_value(MouseState(Point2D(0.5, 0.5), set()))
+        return Result.from_value(MouseState(Point2D(0.5, 0.5), 0))
 
     def next_state(self, state: MouseState) -> ResultE[MouseState]:
         i = mouse.activeInputs
 
-        pos = Point2D.from_tuple(mouse.position)
-        buttons = set(filter(lambda b: b.event in i and KX_INPUT_ACTIVE in i[b.event].status, MouseButton))
+        mask = 0
+
+        for (event, button_mask) in _BUTTON_INPUTS:
+            value = i.get(event)
+
+            if value is not None and KX_INPUT_ACTIVE in value.status:
+                mask |= button_mask
+
+        if self.use_event_queue:
+            self.__read_transitions(i)
+
+        (x, y) = mouse.position
+
+        if mask == state.button_mask and x == state.position.x and y == state.position.y:
+            return self.state
 
-        return Result.from_value(MouseState(pos, buttons))
+        return Result.from_value(MouseState(Point2D(x, y), mask))
+
+    def __read_transitions(self, inputs: Mapping[int, SCA_InputEvent]) -> None:
+        for button in _BUTTONS:
+            value = inputs.get(button.event)
+
+            if value is None:
+                continue
+
+            for event in value.queue:
+                if event == KX_INPUT_JUST_ACTIVATED:
+                    self.__transitions.append((button, True))
+                elif event == KX_INPUT_JUST_RELEASED:
+                    self.__transitions.append((button, False))
+
+    def _do_update(self) -> None:
+        last_state = self.state
+
+        super()._do_update()
+
+        if self.__transitions:
+            self.__dispatch_transitions(last_state.unwrap())
+
+    def __dispatch(self, state: MouseState) -> None:
+        last_state = self.__last_state
+
+        self.__last_state = state
+
+        offset = state.position - last_state.position if last_state else _NO_OFFSET
+
+        self.__last_move = MouseMoveEvent(self, state, offset)
+        self.__on_mouse_move.on_next(self.__last_move)
+
+        if last_state is None or self.use_event_queue:
+            return
+
+        last_mask = last_state.button_mask
+        mask = state.button_mask
+
+        changed = last_mask ^ mask
+
+        if changed == 0:
+            return
+
+        pressed = changed & mask
+        released = changed & last_mask
+
+        for button in _BUTTONS:
+            if pressed & button.mask:
+                self.__on_mouse_down.on_next(MouseDownEvent(self, state, button))
+            elif released & button.mask:
+                self.__on_mouse_up.on_next(MouseUpEvent(self, state, button))
+
+    def __dispatch_transitions(self, last_state: MouseState) -> None:
+        position = self.state.unwrap().position
+        mask = last_state.button_mask
+
+        for (button, pressed) in self.__transitions:
+            if pressed:
+                mask |= button.mask
+                self.__on_mouse_down.on_next(MouseDownEvent(self, MouseState(position, mask), button))
+            else:
+                mask &= ~button.mask
+                self.__on_mouse_up.on_next(MouseUpEvent(self, MouseState(position, mask), button))
+
+        self.__transitions.clear()
+
+    def __complete(self) -> None:
+        for subject in (self.__on_mouse_move, self.__on_mouse_down, self.__on_mouse_up):
+            subject.on_completed()
+            subject.dispose()
 
     @property
     def on_mouse_move(self) -> Observable[MouseMoveEvent]:
-        return self.on_state_change.pipe(
-            ops.map(partial(MouseMoveEvent, self)),
-            ops.distinct_until_changed())
+        return self.__on_mouse_move_replay
+
+    def __replay_last_move(self, _) -> Observable[MouseMoveEvent]:
+        subject = self.__on_mouse_move
+
+        if self.__last_move is not None and not subject.is_stopped:
+            return subject.pipe(ops.start_with(self.__last_move))
+
+        return subject
 
     @property
     def on_mouse_down(self) -> Observable[MouseButtonEvent]:
-        return self.on_state_change.pipe(
-            ops.map(lambda s: s.buttons),
-            ops.distinct_until_changed(),
-            ops.pairwise(),
-            ops.flat_map(lambda b: b[1] - b[0]),
-            ops.map(lambda b: MouseDownEvent(self, self.state.unwrap(), b)))
+        return self.__on_mouse_down
 
     @property
     def on_mouse_up(self) -> Observable[MouseButtonEvent]:
-        return self.on_state_change.pipe(
-            ops.map(lambda s: s.buttons),
-            ops.distinct_until_changed(),
-            ops.pairwise(),
-            ops.flat_map(lambda b: b[0] - b[1]),
-            ops.map(lambda b: MouseUpEvent(self, self.state.unwrap(), b)))
+        return self.__on_mouse_up
 
 
 @dataclass(frozen=True)
@@ -91,7 +223,7 @@ class MouseEvent(InputEvent[MouseInputSource], ABC):
         return self.state.position
 
     @property
-    def buttons(self) -> Set[MouseButton]:
+    def buttons(self) -> FrozenSet[MouseButton]:
         return self.state.buttons
 
     def __post_init__(self) -> None:
@@ -112,8 +244,10 @@ class MouseButtonEvent(MouseEvent, ABC):
             raise ValueError("Argument 'button' is required.")
 
 
+@dataclass(frozen=True)
 class MouseMoveEvent(MouseEvent):
-    pass
+    # Sampled once per frame, even in event queue mode: intermediate motion events are not summed.
+    offset: Point2D = _NO_OFFSET
 
 
 class MouseDownEvent(MouseButtonEvent):
@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from struct import Struct
+from typing import Callable, Final, Iterator, Optional, Union
+
+import bge
+from validator_collection import not_empty
+
+from alleycat.common import Point2D
+from alleycat.input import KeyboardInputSource, KeyboardState, MouseInputSource, MouseState
+from alleycat.lifecycle import BaseDisposable, Updatable
+
+MAGIC: Final = b"ACIR\x02"
+
+_HEADER: Final = Struct("<dIB")
+_MOUSE: Final = Struct("<dIBddH")
+_KEYBOARD: Final = Struct("<dIBH")
+
+
+class RecordType(Enum):
+    Mouse = 1
+    Keyboard = 2
+    End = 3
+
+
+@dataclass(frozen=True)
+class InputRecord:
+    time: float
+
+    frame: int
+
+    state: Optional[Union[MouseState, KeyboardState]]
+
+    __slots__ = ("time", "frame", "state")
+
+
+class InputRecorder(Updatable, BaseDisposable):
+
+    def __init__(self, timer: Optional[Callable[[], float]] = None) -> None:
+        super().__init__()
+
+        self.__timer = timer if timer else bge.logic.getFrameTime
+        self.__buffer = bytearray(MAGIC)
+        self.__frame = [0]
+
+    @property
+    def frame(self) -> int:
+        return self.__frame[0]
+
+    @property
+    def data(self) -> bytes:
+        return bytes(self.__buffer) + _HEADER.pack(self.__timer(), self.__frame[0], RecordType.End.value)
+
+    def _do_update(self) -> None:
+        self.__frame[0] += 1
+
+    def record_mouse(self, source: MouseInputSource) -> None:
+        self._check_disposed()
+
+        pack = _MOUSE.pack
+        timer = self.__timer
+        buffer = self.__buffer
+        frame = self.__frame
+        tpe = RecordType.Mouse.value
+
+        def record(state: MouseState) -> None:
+            position = state.position
+            buffer.extend(pack(timer(), frame[0], tpe, position.x, position.y, state.button_mask))
+
+        self._subscribe_until_dispose(not_empty(source).on_state_change, record)
+
+    def record_keyboard(self, source: KeyboardInputSource) -> None:
+        self._check_disposed()
+
+        pack = _KEYBOARD.pack
+        timer = self.__timer
+        buffer = self.__buffer
+        frame = self.__frame
+        tpe = RecordType.Keyboard.value
+
+        def record(state: KeyboardState) -> None:
+            mask = state.key_mask.to_bytes((state.key_mask.bit_length() + 7) // 8, "little")
+
+            buffer.extend(pack(timer(), frame[0], tpe, len(mask)))
+            buffer.extend(mask)
+
+        self._subscribe_until_dispose(not_empty(source).on_state_change, record)
+
+    def save(self, path: Path) -> None:
+        with open(path, "wb") as f:
+            f.write(self.data)
+
+
+def read_records(data: bytes) -> Iterator[InputRecord]:
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a valid input recording.")
+
+    offset = len(MAGIC)
+    size = len(data)
+
+    while offset + _HEADER.size <= size:
+        (time, frame, tpe) = _HEADER.unpack_from(data, offset)
+
+        if tpe == RecordType.Mouse.value:
+            if offset + _MOUSE.size > size:
+                return
+
+            (_, _, _, x, y, mask) = _MOUSE.unpack_from(data, offset)
+
+            offset += _MOUSE.size
+
+            yield InputRecord(time, frame, MouseState(Point2D(x, y), mask))
+        elif tpe == RecordType.Keyboard.value:
+            if offset + _KEYBOARD.size > size:
+                return
+
+            (_, _, _, length) = _KEYBOARD.unpack_from(data, offset)
+
+            if offset + _KEYBOARD.size + length > size:
+                return
+
+            offset += _KEYBOARD.size
+
+            mask = int.from_bytes(data[offset:offset + length], "little")
+
+            offset += length
+
+            yield InputRecord(time, frame, KeyboardState(mask))
+        elif tpe == RecordType.End.value:
+            offset += _HEADER.size
+
+            yield InputRecord(time, frame, None)
+        else:
+            raise ValueError(f"Unknown record type: {tpe}.")
+
+
+def load_records(path: Path) -> Iterator[InputRecord]:
+    with open(path, "rb") as f:
+        data = f.read()
+
+    return read_records(data)
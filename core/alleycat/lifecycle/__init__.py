@@ -1,3 +1,20 @@
-from .disposable import Disposable, DisposableCollection, BaseDisposable, AlreadyDisposedError, RESULT_DISPOSED
-from .startable import Startable, AlreadyStartedError, NotStartedError, RESULT_NOT_STARTED
-from .updatable import Updatable
+from typing import TYPE_CHECKING
+
+from alleycat.common.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".disposable": ("Disposable", "DisposableCollection", "BaseDisposable", "AlreadyDisposedError", "RESULT_DISPOSED"),
+    ".startable": ("Startable", "AlreadyStartedError", "NotStartedError", "RESULT_NOT_STARTED"),
+    ".updatable": ("Updatable", "TimedUpdatable"),
+    ".pool": ("ObjectPool",),
+    ".tracker": ("LeakTracker", "LeakRecord"),
+    ".teardown": ("Teardown",)
+})
+
+if TYPE_CHECKING:
+    from .disposable import Disposable, DisposableCollection, BaseDisposable, AlreadyDisposedError, RESULT_DISPOSED
+    from .startable import Startable, AlreadyStartedError, NotStartedError, RESULT_NOT_STARTED
+    from .updatable import Updatable, TimedUpdatable
+    from .pool import ObjectPool
+    from .tracker import LeakTracker, LeakRecord
+    from .teardown import Teardown
@@ -1,10 +1,9 @@
-from typing import Final, List, Optional, TypeVar, Union, final
+from typing import ClassVar, Dict, Final, Iterator, Optional, Protocol, Tuple, TypeVar, Union, final
 
 from reactivex import Observable, Subject
 from reactivex.abc import DisposableBase, ObserverBase, OnCompleted, OnError, OnNext, SchedulerBase
 from reactivex.disposable import Disposable
 from returns.result import Result
-from validator_collection import not_empty
 
 from alleycat.common import IllegalStateError
 
@@ -18,21 +17,67 @@ RESULT_DISPOSED: Final = Result.from_failure(
 
 
 class DisposableCollection(Disposable):
+    min_prune_size: int = 64
+
     def __init__(self) -> None:
         super().__init__()
 
-        self.__disposables: List[DisposableBase] = []
+        self.__disposables: Dict[int, DisposableBase] = dict()
+        self.__prune_size = self.min_prune_size
+
+    def __len__(self) -> int:
+        return len(self.__disposables)
+
+    def __contains__(self, disposable: DisposableBase) -> bool:
+        return self.__disposables.get(id(disposable)) is disposable
+
+    def __iter__(self) -> Iterator[DisposableBase]:
+        return iter(tuple(self.__disposables.values()))
 
     @final
     def append(self, disposable: DisposableBase) -> None:
-        if not_empty(disposable) not in self.__disposables:
-            self.__disposables.append(disposable)
+        if disposable is None:
+            raise ValueError("Argument 'disposable' is required.")
+
+        key = id(disposable)
+
+        if key in self.__disposables:
+            return
+
+        self.__disposables[key] = disposable
+
+        if len(self.__disposables) >= self.__prune_size:
+            self.prune()
+
+    @final
+    def remove(self, disposable: DisposableBase) -> bool:
+        key = id(disposable)
+
+        if self.__disposables.get(key) is not disposable:
+            return False
+
+        del self.__disposables[key]
+
+        return True
+
+    @final
+    def prune(self) -> None:
+        disposables = self.__disposables
+
+        for key in [k for (k, v) in disposables.items() if getattr(v, "is_disposed", False)]:
+            del disposables[key]
+
+        self.__prune_size = max(self.min_prune_size, len(disposables) * 2)
 
     def dispose(self) -> None:
         if self.is_disposed:
             raise RESULT_DISPOSED.failure()
 
-        for disposable in self.__disposables:
+        disposables = tuple(self.__disposables.values())
+
+        self.__disposables.clear()
+
+        for disposable in disposables:
             # noinspection PyBroadException
             try:
                 disposable.dispose()
@@ -45,27 +90,96 @@ class DisposableCollection(Disposable):
 T = TypeVar("T")
 
 
+class DisposableTracker(Protocol):
+    def track(self, owner: "BaseDisposable") -> None:
+        pass
+
+    def track_collection(self, owner: "BaseDisposable", collection: DisposableCollection) -> None:
+        pass
+
+    def untrack(self, owner: "BaseDisposable") -> None:
+        pass
+
+
 class BaseDisposable(Disposable):
-    _disposables: Final[DisposableCollection]
+    _leak_tracker: ClassVar[Optional[DisposableTracker]] = None
 
     def __init__(self) -> None:
         super().__init__()
 
-        self.__on_dispose = Subject[None]()
-        self._disposables = DisposableCollection()
+        self.__on_dispose: Optional[Subject[None]] = None
+        self.__disposables: Optional[DisposableCollection] = None
+
+        tracker = BaseDisposable._leak_tracker
+
+        if tracker is not None:
+            tracker.track(self)
+
+    @property
+    def _disposables(self) -> DisposableCollection:
+        if self.__disposables is None:
+            self.__disposables = DisposableCollection()
+
+            tracker = BaseDisposable._leak_tracker
+
+            if tracker is not None:
+                tracker.track_collection(self, self.__disposables)
+
+        return self.__disposables
 
     def dispose(self) -> None:
+        self._check_disposed()
+
         super().dispose()
 
-        self._disposables.dispose()
+        tracker = BaseDisposable._leak_tracker
+
+        if tracker is not None:
+            tracker.untrack(self)
+
+        if self.__disposables is not None:
+            self.__disposables.dispose()
+
+        on_dispose = self.__on_dispose
+
+        if on_dispose is not None:
+            if on_dispose.observers:
+                on_dispose.on_next(None)
+                on_dispose.on_completed()
+
+            on_dispose.dispose()
+
+    @final
+    @property
+    def _owned(self) -> Tuple["BaseDisposable", ...]:
+        if self.__disposables is None:
+            return ()
+
+        return tuple(d for d in self.__disposables if isinstance(d, BaseDisposable))
+
+    def _reset(self) -> None:
+        if not self.is_disposed:
+            raise IllegalStateError("Only a disposed object can be reset.")
+
+        self.__on_dispose = None
+        self.__disposables = None
 
-        self.__on_dispose.on_next(None)
-        self.__on_dispose.on_completed()
-        self.__on_dispose.dispose()
+        self.is_disposed = False
+
+        tracker = BaseDisposable._leak_tracker
+
+        if tracker is not None:
+            tracker.track(self)
 
     @final
     @property
     def on_dispose(self) -> Observable[None]:
+        if self.__on_dispose is None:
+            self.__on_dispose = Subject[None]()
+
+            if self.is_disposed:
+                self.__on_dispose.dispose()
+
         return self.__on_dispose
 
     @final
@@ -80,10 +194,42 @@ class BaseDisposable(Disposable):
                                  on_error: Optional[OnError] = None,
                                  on_completed: Optional[OnCompleted] = None,
                                  scheduler: Optional[SchedulerBase] = None, ) -> None:
+        disposables = self._disposables
+
+        if isinstance(on_next, ObserverBase):
+            disposables.append(stream.subscribe(on_next, scheduler=scheduler))
+            return
+
+        subscription: Optional[DisposableBase] = None
+        stopped = False
+
+        def stop() -> None:
+            nonlocal stopped
+
+            stopped = True
+
+            if subscription is not None:
+                disposables.remove(subscription)
+
+        def complete() -> None:
+            stop()
+
+            if on_completed:
+                on_completed()
+
+        def error(e: Exception) -> None:
+            stop()
+
+            if on_error:
+                on_error(e)
+            else:
+                raise e
+
         subscription = stream.subscribe(
             on_next=on_next,
-            on_error=on_error,
-            on_completed=on_completed,
+            on_error=error,
+            on_completed=complete,
             scheduler=scheduler)
 
-        self._disposables.append(subscription)
+        if not stopped:
+            disposables.append(subscription)
@@ -0,0 +1,75 @@
+import logging
+from typing import Any, Callable, Final, Generic, List, OrderedDict, Set, TypeVar
+
+from validator_collection import not_empty
+
+from alleycat.common import LoggingSupport
+from alleycat.lifecycle import Startable
+
+T = TypeVar("T", bound=Startable)
+
+
+class ObjectPool(LoggingSupport, Generic[T]):
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    max_size: Final[int]
+
+    def __init__(self, factory: Callable[[], T], max_size: int = 64) -> None:
+        super().__init__()
+
+        if max_size < 0:
+            raise ValueError(f"Maximum pool size must be zero or a positive integer (found: {max_size}).")
+
+        self.max_size = max_size
+
+        self.__factory = not_empty(factory)
+        self.__instances: List[T] = []
+        self.__pooled: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.__instances)
+
+    def acquire(self, args: OrderedDict[str, Any]) -> T:
+        if self.__instances:
+            instance = self.__instances.pop()
+            self.__pooled.discard(id(instance))
+        else:
+            instance = self.__factory()
+
+        instance.start(args)
+
+        return instance
+
+    def release(self, instance: T) -> bool:
+        if id(instance) in self.__pooled:
+            raise ValueError(f"The object has already been released: {instance}.")
+
+        if not instance.is_disposed:
+            instance.dispose()
+
+        if len(self.__instances) >= self.max_size:
+            return False
+
+        # noinspection PyBroadException
+        try:
+            # noinspection PyProtectedMember
+            instance._reset()
+        except Exception:
+            self.logger.exception("Failed to reset a pooled object: %s.", instance)
+            return False
+
+        self.__instances.append(instance)
+        self.__pooled.add(id(instance))
+
+        return True
+
+    def fill(self, count: int) -> None:
+        for _ in range(min(count, self.max_size - len(self.__instances))):
+            instance = self.__factory()
+
+            self.__instances.append(instance)
+            self.__pooled.add(id(instance))
+
+    def clear(self) -> None:
+        self.__instances.clear()
+        self.__pooled.clear()
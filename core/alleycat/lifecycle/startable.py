@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Any, Final, OrderedDict, final
+from typing import Any, Final, Optional, OrderedDict, final
 
 from reactivex import Observable, Subject
 from returns.result import Failure, Result, ResultE, Success
@@ -26,7 +26,7 @@ class Startable(BaseDisposable, ABC):
 
         self.__started = False
         self.__start_args: ResultE[MapReader] = RESULT_NOT_STARTED
-        self.__on_start = Subject[MapReader]()
+        self.__on_start: Optional[Subject[MapReader]] = None
 
     @final
     @property
@@ -36,6 +36,16 @@ class Startable(BaseDisposable, ABC):
     @final
     @property
     def on_start(self) -> Observable[MapReader]:
+        if self.__on_start is None:
+            self.__on_start = Subject[MapReader]()
+
+            if self.is_disposed:
+                self.__on_start.dispose()
+            elif self.__started:
+                match self.__start_args:
+                    case Failure(e):
+                        self.__on_start.on_error(e)
+
         return self.__on_start
 
     @final
@@ -50,6 +60,9 @@ class Startable(BaseDisposable, ABC):
         self.__start_args = self._do_start(MapReader(of_type(args, dict)))
         self.__started = True
 
+        if self.__on_start is None:
+            return
+
         match self.__start_args:
             case Success(v):
                 self.__on_start.on_next(v)
@@ -59,6 +72,13 @@ class Startable(BaseDisposable, ABC):
     def _do_start(self, args: MapReader) -> ResultE[MapReader]:
         return Result.from_value(args)
 
+    def _reset(self) -> None:
+        super()._reset()
+
+        self.__started = False
+        self.__start_args = RESULT_NOT_STARTED
+        self.__on_start = None
+
     @final
     def _check_started(self) -> None:
         if not self.started:
@@ -67,9 +87,12 @@ class Startable(BaseDisposable, ABC):
     def dispose(self) -> None:
         super().dispose()
 
-        if self.__on_start.exception is None:
-            self.__on_start.on_completed()
+        on_start = self.__on_start
+
+        if on_start is not None:
+            if on_start.exception is None and on_start.observers:
+                on_start.on_completed()
 
-        self.__on_start.dispose()
+            on_start.dispose()
 
         self.__start_args = RESULT_DISPOSED
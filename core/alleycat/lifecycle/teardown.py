@@ -0,0 +1,153 @@
+import logging
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, Iterable, List, Optional
+
+from reactivex import Observable, Subject
+
+from alleycat.common import LoggingSupport
+from alleycat.lifecycle import BaseDisposable, Updatable
+
+
+class Teardown(Updatable, LoggingSupport):
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self,
+                 roots: Iterable[BaseDisposable],
+                 max_per_update: Optional[int] = None,
+                 time_budget: Optional[float] = None) -> None:
+        super().__init__()
+
+        if max_per_update is not None and max_per_update < 1:
+            raise ValueError(f"Maximum disposals per update must be a positive integer (found: {max_per_update}).")
+
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(f"Time budget must be a positive number (found: {time_budget}).")
+
+        self.__max_per_update = max_per_update
+        self.__time_budget = time_budget
+
+        self.__queue: Deque[BaseDisposable] = deque(self.__resolve_order(roots))
+        self.__total = len(self.__queue)
+
+        self.__on_complete = Subject[int]()
+
+    @staticmethod
+    def __resolve_order(roots: Iterable[BaseDisposable]) -> List[BaseDisposable]:
+        nodes: Dict[int, BaseDisposable] = dict()
+        owners: Dict[int, int] = dict()
+
+        pending = list(roots)
+
+        while pending:
+            node = pending.pop()
+
+            if id(node) in nodes or node.is_disposed:
+                continue
+
+            nodes[id(node)] = node
+            owners.setdefault(id(node), 0)
+
+            # noinspection PyProtectedMember
+            for child in node._owned:
+                owners[id(child)] = owners.get(id(child), 0) + 1
+                pending.append(child)
+
+        ready = deque(n for (k, n) in nodes.items() if owners[k] == 0)
+        order: List[BaseDisposable] = []
+
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+
+            # noinspection PyProtectedMember
+            for child in node._owned:
+                key = id(child)
+
+                if key not in nodes:
+                    continue
+
+                owners[key] -= 1
+
+                if owners[key] == 0:
+                    ready.append(child)
+
+        if len(order) < len(nodes):
+            ordered = set(map(id, order))
+            order.extend(n for (k, n) in nodes.items() if k not in ordered)
+
+        return order
+
+    @property
+    def total(self) -> int:
+        return self.__total
+
+    @property
+    def remaining(self) -> int:
+        return len(self.__queue)
+
+    @property
+    def done(self) -> bool:
+        return not self.__queue
+
+    @property
+    def on_complete(self) -> Observable[int]:
+        return self.__on_complete
+
+    @property
+    def can_update(self) -> bool:
+        return not self.__on_complete.is_stopped
+
+    def run(self) -> None:
+        while self.__queue:
+            self.__dispose(self.__queue.popleft())
+
+        self.__complete()
+
+    def _do_update(self) -> None:
+        queue = self.__queue
+
+        limit = self.__max_per_update
+        deadline = perf_counter() + self.__time_budget if self.__time_budget else None
+
+        count = 0
+
+        while queue:
+            self.__dispose(queue.popleft())
+
+            count += 1
+
+            if limit is not None and count >= limit:
+                break
+
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+        if not queue:
+            self.__complete()
+
+    def __dispose(self, node: BaseDisposable) -> None:
+        if node.is_disposed:
+            return
+
+        # noinspection PyProtectedMember
+        owned = node._owned
+
+        for child in owned:
+            # noinspection PyProtectedMember
+            node._disposables.remove(child)
+
+        # noinspection PyBroadException
+        try:
+            node.dispose()
+        except Exception:
+            self.logger.exception("Failed to dispose an object: %s.", node)
+
+    def __complete(self) -> None:
+        if self.__on_complete.is_stopped:
+            return
+
+        self.logger.debug("Disposed %d objects.", self.__total)
+
+        self.__on_complete.on_next(self.__total)
+        self.__on_complete.on_completed()
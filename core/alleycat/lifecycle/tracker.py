@@ -0,0 +1,140 @@
+import logging
+import sys
+from dataclasses import dataclass
+from traceback import StackSummary, walk_stack
+from typing import Dict, Final, List, Optional, Tuple
+from weakref import ref
+
+from alleycat.common import IllegalStateError, LoggingSupport
+from alleycat.lifecycle import BaseDisposable, DisposableCollection
+
+
+@dataclass(frozen=True)
+class LeakRecord:
+    type_name: str
+
+    stack: StackSummary
+
+    subscriptions: int
+
+    __slots__ = ("type_name", "stack", "subscriptions")
+
+    def format(self) -> str:
+        return "".join(self.stack.format())
+
+
+class _TrackedEntry:
+    __slots__ = ("owner", "type_name", "stack", "collection")
+
+    def __init__(self, owner: ref, type_name: str, stack: StackSummary) -> None:
+        self.owner = owner
+        self.type_name = type_name
+        self.stack = stack
+        self.collection: Optional[ref] = None
+
+
+class LeakTracker(LoggingSupport):
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    stack_depth: Final[int]
+
+    def __init__(self, stack_depth: int = 16) -> None:
+        super().__init__()
+
+        if stack_depth < 1:
+            raise ValueError(f"Stack depth must be a positive integer (found: {stack_depth}).")
+
+        self.stack_depth = stack_depth
+
+        self.__entries: Dict[int, _TrackedEntry] = dict()
+        self.__orphaned: List[LeakRecord] = []
+
+    @property
+    def active(self) -> bool:
+        return BaseDisposable._leak_tracker is self
+
+    def start(self) -> None:
+        tracker = BaseDisposable._leak_tracker
+
+        if tracker is not None and tracker is not self:
+            raise IllegalStateError("Another leak tracker is already active.")
+
+        BaseDisposable._leak_tracker = self
+
+        self.logger.info("Started tracking disposable objects.")
+
+    def stop(self) -> None:
+        if self.active:
+            BaseDisposable._leak_tracker = None
+
+            self.logger.info("Stopped tracking disposable objects.")
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__orphaned.clear()
+
+    def track(self, owner: BaseDisposable) -> None:
+        key = id(owner)
+
+        def collected(_: ref) -> None:
+            self.__collected(key)
+
+        frames = walk_stack(sys._getframe(2))
+
+        stack = StackSummary.extract(frames, limit=self.stack_depth, lookup_lines=False)
+        stack.reverse()
+
+        self.__entries[key] = _TrackedEntry(ref(owner, collected), type(owner).__name__, stack)
+
+    def track_collection(self, owner: BaseDisposable, collection: DisposableCollection) -> None:
+        entry = self.__entries.get(id(owner))
+
+        if entry is not None and entry.owner() is owner:
+            entry.collection = ref(collection)
+
+    def untrack(self, owner: BaseDisposable) -> None:
+        entry = self.__entries.get(id(owner))
+
+        if entry is not None and entry.owner() is owner:
+            del self.__entries[id(owner)]
+
+    def __collected(self, key: int) -> None:
+        entry = self.__entries.pop(key, None)
+
+        if entry is None or entry.collection is None:
+            return
+
+        collection = entry.collection()
+
+        if collection is not None and not collection.is_disposed and len(collection) > 0:
+            self.__orphaned.append(LeakRecord(entry.type_name, entry.stack, len(collection)))
+
+    @property
+    def undisposed(self) -> Tuple[LeakRecord, ...]:
+        def subscriptions(entry: _TrackedEntry) -> int:
+            collection = entry.collection() if entry.collection else None
+            return len(collection) if collection is not None else 0
+
+        return tuple(LeakRecord(e.type_name, e.stack, subscriptions(e))
+                     for e in tuple(self.__entries.values()) if e.owner() is not None)
+
+    @property
+    def orphaned(self) -> Tuple[LeakRecord, ...]:
+        return tuple(self.__orphaned)
+
+    def report(self) -> Tuple[Tuple[LeakRecord, ...], Tuple[LeakRecord, ...]]:
+        undisposed = self.undisposed
+        orphaned = self.orphaned
+
+        for record in undisposed:
+            self.logger.warning("%s was never disposed (subscriptions: %d). Allocated at:\n%s",
+                                record.type_name, record.subscriptions, record.format())
+
+        for record in orphaned:
+            self.logger.warning("%s was collected without being disposed, leaving %d subscriptions. Allocated at:\n%s",
+                                record.type_name, record.subscriptions, record.format())
+
+        self.logger.info("Found %d undisposed objects and %d orphaned subscription groups.",
+                         len(undisposed), len(orphaned))
+
+        return undisposed, orphaned
@@ -16,3 +16,17 @@ class Updatable(ABC):
     def update(self) -> None:
         if self.can_update:
             self._do_update()
+
+
+class TimedUpdatable(Updatable, ABC):
+    __elapsed: float = 0.
+
+    @final
+    @property
+    def elapsed(self) -> float:
+        return self.__elapsed
+
+    @final
+    def update_elapsed(self, elapsed: float) -> None:
+        self.__elapsed = elapsed
+        self.update()
@@ -1 +1,10 @@
-from .manager import StateManager
+from typing import TYPE_CHECKING
+
+from alleycat.common.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".manager": ("StateManager", "UpdateMode")
+})
+
+if TYPE_CHECKING:
+    from .manager import StateManager, UpdateMode
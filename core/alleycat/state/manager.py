@@ -1,25 +1,55 @@
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Generic, TypeVar, final
+from enum import Enum
+from typing import Callable, Generic, Optional, TypeVar, final
 
-from reactivex import Observable, operators as ops
-from reactivex.subject import ReplaySubject
+from reactivex import Observable, defer, operators as ops
+from reactivex.subject import Subject
 from returns.pipeline import is_successful
 from returns.result import ResultE
 
 from alleycat.common import LoggingSupport
+from alleycat.event import TimeMode, get_timer
 from alleycat.lifecycle import RESULT_DISPOSED, RESULT_NOT_STARTED, Startable, Updatable
 
 TState = TypeVar("TState")
 
 
+class UpdateMode(Enum):
+    Frame = 0
+    Fixed = 1
+    Reduced = 2
+
+
 class StateManager(Startable, Updatable, LoggingSupport, Generic[TState], ABC):
+    update_mode: UpdateMode = UpdateMode.Frame
+
+    update_rate: float = 60.
+
+    max_steps: int = 5
+
+    time_mode: TimeMode = TimeMode.Frame
 
     def __init__(self) -> None:
         super().__init__()
 
+        self.__timer: Optional[Callable[[], float]] = None
+        self.__time: Optional[float] = None
+        self.__accumulator = 0.
+
         self.__state = RESULT_NOT_STARTED
-        self.__state_subject = ReplaySubject[TState](buffer_size=1)
+        self.__state_subject = Subject[TState]()
+
+        self.__emitted = False
+        self.__last_state: Optional[TState] = None
+
+        def replay_last_state(_) -> Observable[TState]:
+            if self.__emitted and not self.__state_subject.is_stopped:
+                return self.__state_subject.pipe(ops.start_with(self.__last_state))
+
+            return self.__state_subject
+
+        self.__on_state_change = defer(replay_last_state)
 
     @property
     @abstractmethod
@@ -37,25 +67,117 @@ class StateManager(Startable, Updatable, LoggingSupport, Generic[TState], ABC):
 
     @property
     def on_state_change(self) -> Observable[TState]:
-        return self.__state_subject.pipe(ops.distinct_until_changed())
+        return self.__on_state_change
+
+    @property
+    def timer(self) -> Callable[[], float]:
+        if self.__timer is None:
+            self.__timer = get_timer(self.time_mode)
+
+        return self.__timer
+
+    @timer.setter
+    def timer(self, timer: Callable[[], float]) -> None:
+        if self.__time is not None:
+            self.__time = timer()
+
+        self.__timer = timer
+
+    @property
+    def alpha(self) -> float:
+        if self.update_mode == UpdateMode.Fixed:
+            return min(self.__accumulator * self.update_rate, 1.)
+
+        return 1.
 
     def _do_update(self) -> None:
-        self.__state = self.state.bind(self.next_state)
+        mode = self.update_mode
+
+        if mode == UpdateMode.Frame:
+            self.__step()
+            return
+
+        now = self.timer()
+
+        if self.__time is None:
+            self.__time = now
+            self.__step()
+            return
+
+        interval = 1. / self.update_rate
 
-        if is_successful(self.__state):
-            self.__state_subject.on_next(self.__state.unwrap())
+        if mode == UpdateMode.Fixed:
+            self.__accumulator += now - self.__time
+            self.__time = now
+
+            steps = 0
+
+            while self.__accumulator >= interval:
+                if steps == self.max_steps:
+                    self.__accumulator %= interval
+                    break
+
+                self.__step()
+
+                self.__accumulator -= interval
+                steps += 1
         else:
-            self.logger.warning("Failed to update state: %s", self.__state.failure())
+            elapsed = now - self.__time
+
+            if elapsed < interval:
+                return
+
+            self.__time = now if elapsed >= interval * 2 else self.__time + interval
+
+            self.__step()
+
+    def __step(self) -> None:
+        current = self.__state
+
+        self.__state = current.bind(self.next_state)
+
+        if self.__state is current and self.__emitted:
+            return
+
+        self.__publish(self.__state)
+
+    def __publish(self, result: ResultE[TState]) -> None:
+        if is_successful(result):
+            state = result.unwrap()
+
+            if not self.__emitted or (state is not self.__last_state and state != self.__last_state):
+                self.__emitted = True
+                self.__last_state = state
+
+                self.__state_subject.on_next(state)
+        else:
+            self.logger.warning("Failed to update state: %s", result.failure())
 
     def start(self, args: OrderedDict) -> None:
         super().start(args)
 
         self.__state = self.init_state
 
+        self.__time = None
+        self.__accumulator = 0.
+
+    def _reset(self) -> None:
+        super()._reset()
+
+        self.__state = RESULT_NOT_STARTED
+        self.__state_subject = Subject[TState]()
+
+        self.__emitted = False
+        self.__last_state = None
+
+        self.__time = None
+        self.__accumulator = 0.
+
     def dispose(self) -> None:
         self.__state_subject.on_completed()
         self.__state_subject.dispose()
 
         self.__state = RESULT_DISPOSED
+        self.__last_state = None
 
         super().dispose()
@@ -27,6 +27,30 @@ class SCA_PythonMouse:
     visible: bool = True
 
 
+# noinspection PyPep8Naming
+class SCA_PythonKeyboard:
+    events: Dict[int, SCA_InputEvent] = dict()
+
+    activeInputs: Dict[int, SCA_InputEvent] = dict()
+
+
+# noinspection PyPep8Naming
+class SCA_PythonJoystick:
+    name: str = "Mock Joystick"
+
+    axisValues: List[float] = [0.] * 6
+
+    activeButtons: List[int] = []
+
+    @property
+    def numAxis(self) -> int:
+        return len(self.axisValues)
+
+    @property
+    def numButtons(self) -> int:
+        return 16
+
+
 def setup() -> None:
     def setup_bge(module: ModuleType):
         module.types = mock_module("bge.types", setup_types)
@@ -54,9 +78,12 @@ def setup_types(module: ModuleType) -> None:
         pass
 
     module.SCA_IObject = SCA_IObject
+    module.SCA_InputEvent = SCA_InputEvent
     module.KX_GameObject = KX_GameObject
     module.KX_PythonComponent = KX_PythonComponent
     module.SCA_PythonMouse = SCA_PythonMouse
+    module.SCA_PythonKeyboard = SCA_PythonKeyboard
+    module.SCA_PythonJoystick = SCA_PythonJoystick
 
 
 # noinspection PyPep8Naming
@@ -87,6 +114,8 @@ def setup_logic(module: ModuleType) -> None:
     module.KX_INPUT_JUST_RELEASED = 3
 
     module.mouse = SCA_PythonMouse()
+    module.keyboard = SCA_PythonKeyboard()
+    module.joysticks = [None] * 8
 
 
 # noinspection PyPep8Naming,SpellCheckingInspection
@@ -94,3 +123,10 @@ def setup_events(module: ModuleType) -> None:
     module.LEFTMOUSE = 116
     module.MIDDLEMOUSE = 117
     module.RIGHTMOUSE = 118
+
+    for (i, c) in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
+        setattr(module, f"{c}KEY", 23 + i)
+
+    module.SPACEKEY = 212
+    module.ESCKEY = 218
+    module.LEFTSHIFTKEY = 217
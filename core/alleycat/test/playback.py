@@ -0,0 +1,49 @@
+from typing import Dict, Iterable, Iterator, List
+
+from bge.logic import KX_INPUT_ACTIVE, keyboard, mouse
+
+from alleycat.input import InputRecord, KeyboardState, MouseState
+from alleycat.test.mock_bge import SCA_InputEvent
+
+_PRESSED = SCA_InputEvent((KX_INPUT_ACTIVE,))
+
+
+class InputPlayer(Iterable[int]):
+
+    def __init__(self, records: Iterable[InputRecord]) -> None:
+        super().__init__()
+
+        self.__frames: Dict[int, List[InputRecord]] = dict()
+        self.__length = 0
+
+        for record in records:
+            if record.state is None:
+                self.__length = max(self.__length, record.frame)
+                continue
+
+            self.__frames.setdefault(record.frame, []).append(record)
+            self.__length = max(self.__length, record.frame + 1)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __iter__(self) -> Iterator[int]:
+        frames = self.__frames
+
+        for frame in range(self.__length):
+            for record in frames.get(frame, ()):
+                self.apply(record)
+
+            yield frame
+
+    @staticmethod
+    def apply(record: InputRecord) -> None:
+        state = record.state
+
+        if isinstance(state, MouseState):
+            mouse.position = state.position.tuple
+            mouse.activeInputs = dict((b.event, _PRESSED) for b in state.buttons)
+        elif isinstance(state, KeyboardState):
+            keyboard.activeInputs = dict((k, _PRESSED) for k in state.keys)
+        else:
+            raise ValueError(f"Unknown input state: {state}.")
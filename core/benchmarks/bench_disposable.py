@@ -0,0 +1,91 @@
+from timeit import timeit
+from typing import List
+
+from reactivex import Subject
+from reactivex.abc import DisposableBase
+from reactivex.disposable import Disposable
+
+from alleycat.lifecycle import BaseDisposable, DisposableCollection
+
+SUBSCRIPTIONS = 10_000
+
+
+class ListDisposableCollection(Disposable):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.disposables: List[DisposableBase] = []
+
+    def append(self, disposable: DisposableBase) -> None:
+        if disposable not in self.disposables:
+            self.disposables.append(disposable)
+
+    def __len__(self) -> int:
+        return len(self.disposables)
+
+    def dispose(self) -> None:
+        for disposable in self.disposables:
+            disposable.dispose()
+
+        super().dispose()
+
+
+def report(name: str, seconds: float, size: int) -> None:
+    print(f"{name:<48}{seconds * 1_000:>10.2f} ms{size:>10} entries")
+
+
+def bench_append(name: str, collection) -> None:
+    disposables = [Disposable() for _ in range(SUBSCRIPTIONS)]
+
+    def append() -> None:
+        for disposable in disposables:
+            collection.append(disposable)
+
+    report(name, timeit(append, number=1), len(collection))
+
+    collection.dispose()
+
+
+def bench_short_lived(name: str, collection) -> None:
+    def append() -> None:
+        for _ in range(SUBSCRIPTIONS):
+            disposable = Disposable()
+
+            collection.append(disposable)
+            disposable.dispose()
+
+    report(name, timeit(append, number=1), len(collection))
+
+    collection.dispose()
+
+
+def bench_subscriptions() -> None:
+    component = BaseDisposable()
+
+    def subscribe() -> None:
+        for _ in range(SUBSCRIPTIONS):
+            subject = Subject[int]()
+
+            # noinspection PyProtectedMember
+            component._subscribe_until_dispose(subject, lambda _: None)
+
+            subject.on_completed()
+
+    # noinspection PyProtectedMember
+    report("_subscribe_until_dispose (completed streams)", timeit(subscribe, number=1), len(component._disposables))
+
+    component.dispose()
+
+
+def main() -> None:
+    bench_append("List (append)", ListDisposableCollection())
+    bench_append("DisposableCollection (append)", DisposableCollection())
+
+    bench_short_lived("List (disposed early)", ListDisposableCollection())
+    bench_short_lived("DisposableCollection (disposed early)", DisposableCollection())
+
+    bench_subscriptions()
+
+
+if __name__ == "__main__":
+    main()
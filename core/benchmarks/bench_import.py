@@ -0,0 +1,74 @@
+import subprocess
+import sys
+from typing import Dict, Set, Tuple
+
+SETUP = "from alleycat.test import mock_bge, mock_bpy; mock_bpy.setup(); mock_bge.setup()"
+
+MARKER = "-- alleycat --"
+
+RUNS = 5
+
+DEPENDENCIES = ("reactivex", "returns", "trio", "dependency_injector", "validator_collection")
+
+TARGETS: Tuple[Tuple[str, Set[str]], ...] = (
+    ("import alleycat.common", {"reactivex", "trio", "dependency_injector", "validator_collection"}),
+    ("from alleycat.lifecycle import BaseDisposable", {"trio", "dependency_injector"}),
+    ("from alleycat.event import EventLoopScheduler", {"trio", "dependency_injector"}),
+    ("from alleycat.event import UpdateDispatcher", {"trio", "dependency_injector"}),
+    ("from alleycat.state import StateManager", {"trio"}),
+    ("from alleycat.input import MouseInputSource", {"trio"}),
+    ("from alleycat.core import Bootstrap", {"trio"}),
+    ("from alleycat.event import CoroutineRunner", set()),
+)
+
+
+def measure(statement: str) -> Tuple[int, Dict[str, int]]:
+    script = f"{SETUP}\nimport sys\nsys.stderr.write('{MARKER}\\n')\nsys.stderr.flush()\n{statement}"
+
+    result = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", script), capture_output=True, text=True, check=True)
+
+    (_, _, output) = result.stderr.partition(MARKER)
+
+    modules: Dict[str, int] = dict()
+    total = 0
+
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        (_, cumulative, name) = line[len("import time:"):].split("|")
+
+        modules[name.strip()] = int(cumulative)
+
+        if not name.startswith("  "):
+            total += int(cumulative)
+
+    return total, modules
+
+
+def main() -> None:
+    failures = []
+
+    for (statement, forbidden) in TARGETS:
+        samples = [measure(statement) for _ in range(RUNS)]
+
+        (total, modules) = min(samples, key=lambda s: s[0])
+
+        loaded = [d for d in DEPENDENCIES if d in modules]
+
+        print(f"{statement:<52}{total / 1000:>10.2f} ms  [{', '.join(loaded)}]")
+
+        unexpected = forbidden.intersection(loaded)
+
+        if unexpected:
+            failures.append(f"'{statement}' imported {', '.join(sorted(unexpected))}.")
+
+    for failure in failures:
+        print(failure, file=sys.stderr)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from timeit import timeit
+from typing import Set
+
+from alleycat.test import mock_bge, mock_bpy
+
+mock_bpy.setup()
+mock_bge.setup()
+
+from bge.events import AKEY
+from bge.logic import KX_INPUT_ACTIVE, keyboard
+from reactivex import Observable, operators as ops
+from returns.result import Result, ResultE
+
+from alleycat.core import BaseComponent, bootstrap
+from alleycat.input import KeyboardInputSource
+from alleycat.state import StateManager
+from alleycat.test.mock_bge import SCA_InputEvent
+
+FRAMES = 1_000
+
+KEYS = 26
+
+
+class NaiveKeyboardInputSource(BaseComponent, StateManager[Set[int]]):
+
+    @property
+    def init_state(self) -> ResultE[Set[int]]:
+        return Result.from_value(set())
+
+    def next_state(self, state: Set[int]) -> ResultE[Set[int]]:
+        i = keyboard.activeInputs
+
+        return Result.from_value(set(filter(lambda k: KX_INPUT_ACTIVE in i[k].status, i)))
+
+    @property
+    def on_key_down(self) -> Observable[int]:
+        return self.on_state_change.pipe(
+            ops.pairwise(),
+            ops.flat_map(lambda k: k[1] - k[0]))
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<48}{seconds / FRAMES * 1_000_000:>10.2f} µs/frame")
+
+
+def frames():
+    frame = [0]
+
+    def update_inputs() -> None:
+        frame[0] += 1
+
+        key = AKEY + frame[0] % KEYS
+
+        keyboard.activeInputs = {
+            key: SCA_InputEvent((KX_INPUT_ACTIVE,)),
+            AKEY: SCA_InputEvent((KX_INPUT_ACTIVE,))
+        }
+
+    return update_inputs
+
+
+def bench_naive(bindings: int) -> None:
+    source = NaiveKeyboardInputSource()
+
+    for i in range(bindings):
+        key = AKEY + i % KEYS
+
+        source.on_key_down.pipe(ops.filter(lambda k, expected=key: k == expected)).subscribe(lambda _: None)
+
+    source.start(OrderedDict(()))
+
+    update_inputs = frames()
+
+    def update() -> None:
+        update_inputs()
+        source.update()
+
+    report(f"Naive keyboard ({bindings} bindings)", timeit(update, number=FRAMES))
+
+    source.dispose()
+
+
+def bench_bitset(bindings: int) -> None:
+    source = KeyboardInputSource()
+
+    for i in range(bindings):
+        source.on_key_press(AKEY + i % KEYS).subscribe(lambda _: None)
+
+    source.start(OrderedDict(()))
+
+    update_inputs = frames()
+
+    def update() -> None:
+        update_inputs()
+        source.update()
+
+    report(f"KeyboardInputSource ({bindings} bindings)", timeit(update, number=FRAMES))
+
+    source.dispose()
+
+
+def main() -> None:
+    bootstrap._initialised = True
+
+    for bindings in (10, 100, 1000):
+        bench_naive(bindings)
+        bench_bitset(bindings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import tracemalloc
+from collections import OrderedDict
+from typing import Callable, List
+
+from alleycat.test import mock_bge, mock_bpy
+
+mock_bpy.setup()
+mock_bge.setup()
+
+from alleycat.core import BaseComponent, bootstrap, game_property
+
+COMPONENTS = 50_000
+
+
+class Npc(BaseComponent):
+    speed: float = game_property(1.0)
+
+
+class EagerNpc(Npc):
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        # noinspection PyUnresolvedReferences
+        _ = self.on_dispose, self.on_start, self._disposables, self._PropertyHolder__prop_values
+
+
+def measure(name: str, factory: Callable[[], Npc], start: bool) -> None:
+    tracemalloc.start()
+
+    (before, _) = tracemalloc.get_traced_memory()
+
+    components: List[Npc] = [factory() for _ in range(COMPONENTS)]
+
+    if start:
+        for component in components:
+            component.start(OrderedDict((("Speed", 2.0),)))
+
+    (after, _) = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    print(f"{name:<48}{(after - before) / COMPONENTS:>10.1f} bytes/component")
+
+    for component in components:
+        component.dispose()
+
+
+def main() -> None:
+    bootstrap._initialised = True
+
+    measure("Eager subjects (created)", EagerNpc, False)
+    measure("Lazy subjects (created)", Npc, False)
+
+    measure("Eager subjects (started)", EagerNpc, True)
+    measure("Lazy subjects (started)", Npc, True)
+
+
+if __name__ == "__main__":
+    main()
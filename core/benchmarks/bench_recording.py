@@ -0,0 +1,89 @@
+from collections import OrderedDict
+from timeit import repeat, timeit
+
+from alleycat.test import mock_bge, mock_bpy
+
+mock_bpy.setup()
+mock_bge.setup()
+
+from bge.events import LEFTMOUSE
+from bge.logic import KX_INPUT_ACTIVE, mouse
+
+from alleycat.core import bootstrap
+from alleycat.input import InputRecorder, MouseInputSource, read_records
+from alleycat.test.mock_bge import SCA_InputEvent
+from alleycat.test.playback import InputPlayer
+
+FRAMES = 20_000
+
+REPEAT = 5
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<48}{seconds / FRAMES * 1_000_000:>10.3f} µs/frame")
+
+
+def create_source(recorder: InputRecorder = None) -> MouseInputSource:
+    source = MouseInputSource()
+    source.start(OrderedDict(()))
+
+    if recorder:
+        recorder.record_mouse(source)
+
+    return source
+
+
+def simulate(source: MouseInputSource, frame: list, recorder: InputRecorder = None):
+    pressed = {LEFTMOUSE: SCA_InputEvent((KX_INPUT_ACTIVE,))}
+
+    def update() -> None:
+        frame[0] += 1
+
+        mouse.position = (frame[0] % 1000 / 1000, 0.5)
+        mouse.activeInputs = pressed if frame[0] % 20 < 10 else {}
+
+        source.update()
+
+        if recorder:
+            recorder.update()
+
+    return update
+
+
+def main() -> None:
+    bootstrap._initialised = True
+
+    frame = [0]
+
+    source = create_source()
+    baseline = min(repeat(simulate(source, frame), number=FRAMES, repeat=REPEAT))
+    source.dispose()
+
+    recorder = InputRecorder(lambda: float(frame[0]))
+
+    source = create_source(recorder)
+    recorded = min(repeat(simulate(source, frame, recorder), number=FRAMES, repeat=REPEAT))
+    source.dispose()
+
+    report("MouseInputSource (without recording)", baseline)
+    report("MouseInputSource (with recording)", recorded)
+    report("Recording overhead", recorded - baseline)
+
+    print(f"{'Recording size':<48}{len(recorder.data) / (FRAMES * REPEAT):>10.3f} bytes/frame")
+
+    player = InputPlayer(read_records(recorder.data))
+
+    source = create_source()
+
+    def replay() -> None:
+        for _ in player:
+            source.update()
+
+    report("MouseInputSource (playback)", timeit(replay, number=1) / REPEAT)
+
+    source.dispose()
+    recorder.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import tracemalloc
+from collections import OrderedDict
+from timeit import timeit
+from typing import Callable
+
+from alleycat.test import mock_bge, mock_bpy
+
+mock_bpy.setup()
+mock_bge.setup()
+
+from bge.events import LEFTMOUSE
+from bge.logic import KX_INPUT_ACTIVE, mouse
+from returns.result import Result, ResultE
+
+from alleycat.core import BaseObject, bootstrap
+from alleycat.input import MouseInputSource
+from alleycat.state import StateManager
+from alleycat.test.mock_bge import SCA_InputEvent
+
+SUBSCRIBERS = 100
+
+FRAMES = 1_000
+
+
+class Counter(StateManager[int], BaseObject):
+    step = 1
+
+    @property
+    def init_state(self) -> ResultE[int]:
+        return Result.from_value(0)
+
+    def next_state(self, state: int) -> ResultE[int]:
+        return Result.from_value(state + self.step)
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<48}{seconds / FRAMES * 1_000_000:>10.2f} µs/frame")
+
+
+def allocations(update: Callable[[], None]) -> float:
+    update()
+
+    tracemalloc.start()
+
+    total = 0
+
+    for _ in range(FRAMES):
+        tracemalloc.reset_peak()
+
+        (current, _) = tracemalloc.get_traced_memory()
+
+        update()
+
+        (_, peak) = tracemalloc.get_traced_memory()
+
+        total += peak - current
+
+    tracemalloc.stop()
+
+    return total / FRAMES
+
+
+def report_allocations(name: str, update: Callable[[], None]) -> None:
+    print(f"{name:<48}{allocations(update):>10.2f} bytes/frame")
+
+
+def bench_state_manager() -> None:
+    counter = Counter()
+
+    for _ in range(SUBSCRIBERS):
+        counter.on_state_change.subscribe(lambda _: None)
+
+    counter.start(OrderedDict(()))
+
+    counter.step = 1
+    report(f"StateManager ({SUBSCRIBERS} subscribers, changed)", timeit(counter.update, number=FRAMES))
+
+    counter.step = 0
+    report(f"StateManager ({SUBSCRIBERS} subscribers, unchanged)", timeit(counter.update, number=FRAMES))
+
+    counter.dispose()
+
+
+def bench_mouse_input(subscribers: int) -> None:
+    source = MouseInputSource()
+
+    for _ in range(subscribers):
+        source.on_mouse_move.subscribe(lambda _: None)
+        source.on_mouse_down.subscribe(lambda _: None)
+        source.on_mouse_up.subscribe(lambda _: None)
+
+    source.start(OrderedDict(()))
+
+    pressed = {LEFTMOUSE: SCA_InputEvent((KX_INPUT_ACTIVE,))}
+    frame = [0]
+
+    def update() -> None:
+        frame[0] += 1
+
+        mouse.position = (frame[0] % 100 / 100, 0.5)
+        mouse.activeInputs = pressed if frame[0] % 2 else {}
+
+        source.update()
+
+    mouse.position = (0.5, 0.5)
+    mouse.activeInputs = {}
+
+    report(f"MouseInputSource ({subscribers} subscribers, idle)", timeit(source.update, number=FRAMES))
+    report(f"MouseInputSource ({subscribers} subscribers, active)", timeit(update, number=FRAMES))
+
+    report_allocations(f"MouseInputSource ({subscribers} subscribers, idle)", source.update)
+    report_allocations(f"MouseInputSource ({subscribers} subscribers, active)", update)
+
+    source.dispose()
+
+
+def main() -> None:
+    bootstrap._initialised = True
+
+    bench_state_manager()
+
+    for subscribers in (1, SUBSCRIBERS, SUBSCRIBERS * 10):
+        bench_mouse_input(subscribers)
+
+
+if __name__ == "__main__":
+    main()
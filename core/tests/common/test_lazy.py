@@ -0,0 +1,65 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest import raises
+
+import alleycat.event
+from alleycat.common import profile_imports, stop_profiling_imports
+
+
+def test_lazy_exports():
+    assert "UpdateDispatcher" in alleycat.event.__all__
+    assert "CoroutineRunner" in dir(alleycat.event)
+
+    from alleycat.event import get_timer
+    from alleycat.event.scheduler import get_timer as expected
+
+    assert get_timer is expected
+    assert vars(alleycat.event)["get_timer"] is expected
+
+    with raises(AttributeError, match="module 'alleycat.event' has no attribute 'Missing'"):
+        getattr(alleycat.event, "Missing")
+
+
+def test_import_on_demand():
+    script = "\n".join((
+        "import sys",
+        "from alleycat.test import mock_bge, mock_bpy",
+        "mock_bpy.setup()",
+        "mock_bge.setup()",
+        "from alleycat.event import UpdateDispatcher",
+        "assert 'trio' not in sys.modules",
+        "from alleycat.event import CoroutineRunner",
+        "assert 'trio' in sys.modules"))
+
+    subprocess.run((sys.executable, "-c", script), check=True)
+
+
+def test_lazy_import_traced(tmp_path: Path):
+    root = tmp_path / "lazily"
+    root.mkdir()
+
+    (root / "__init__.py").write_text(
+        "from alleycat.common.lazy import lazy_exports\n\n"
+        "__getattr__, __dir__, __all__ = lazy_exports(__name__, {\".impl\": (\"value\",)})\n")
+    (root / "impl.py").write_text("value = 42\n")
+
+    sys.path.insert(0, str(tmp_path))
+
+    profiler = profile_imports()
+
+    try:
+        import lazily
+
+        assert "lazily.impl" not in sys.modules
+        assert lazily.value == 42
+    finally:
+        stop_profiling_imports()
+
+        sys.path.remove(str(tmp_path))
+
+        for name in ("lazily", "lazily.impl"):
+            sys.modules.pop(name, None)
+
+    assert [e.name for e in profiler.events] == ["lazily", "lazily.impl"]
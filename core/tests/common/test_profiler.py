@@ -0,0 +1,93 @@
+import sys
+from functools import partial
+from importlib import import_module
+from pathlib import Path
+
+from pytest import approx, fixture
+
+from alleycat.common import StartupProfiler, describe, profile_imports, stop_profiling_imports
+
+
+def test_totals():
+    profiler = StartupProfiler()
+
+    profiler.record("alleycat", "import", 1., 3., False)
+    profiler.record("alleycat.core", "import", 1.5, 2.5, True)
+    profiler.record("Inventory", "feature", 3., 3.5)
+
+    with profiler.span("Player.start", "start"):
+        pass
+
+    assert profiler.totals()["import"] == approx(2.)
+    assert profiler.totals()["feature"] == approx(0.5)
+    assert profiler.events[-1].name == "Player.start"
+
+    assert "import: 2000.0 ms" in profiler.summary()
+
+    trace = profiler.to_trace()["traceEvents"]
+
+    assert [e["ts"] for e in trace[:3]] == [0., 500_000., 2_000_000.]
+    assert trace[0]["dur"] == approx(2_000_000.)
+
+
+def test_write(tmp_path: Path):
+    profiler = StartupProfiler()
+    profiler.record("config.json", "config", 0., 0.1)
+
+    trace_file = tmp_path / "trace.json"
+
+    profiler.write(trace_file)
+
+    assert '"name": "config.json"' in trace_file.read_text()
+
+
+@fixture
+def package(tmp_path: Path):
+    root = tmp_path / "traced"
+    root.mkdir()
+
+    (root / "__init__.py").write_text("from .loader import load\n")
+    (root / "loader.py").write_text("import colorsys\n\nload = colorsys.rgb_to_hsv\n")
+
+    sys.path.insert(0, str(tmp_path))
+
+    yield "traced"
+
+    sys.path.remove(str(tmp_path))
+
+    for name in ("traced", "traced.loader", "colorsys"):
+        sys.modules.pop(name, None)
+
+
+def test_profile_imports(package: str):
+    sys.modules.pop("colorsys", None)
+
+    profiler = profile_imports()
+
+    assert profile_imports() is profiler
+
+    import_module(package)
+    import_module(package)
+
+    assert stop_profiling_imports() is profiler
+    assert stop_profiling_imports() is None
+
+    events = {e.name: e for e in profiler.events if e.category == "import"}
+
+    assert set(events.keys()) == {"traced", "traced.loader", "colorsys"}
+
+    assert not events["traced"].nested
+    assert events["traced.loader"].nested
+    assert events["colorsys"].nested
+
+    assert events["traced"].start <= events["traced.loader"].start <= events["colorsys"].start
+    assert events["colorsys"].end <= events["traced.loader"].end <= events["traced"].end
+
+
+def test_describe():
+    class Component:
+        def start(self) -> None:
+            pass
+
+    assert describe(partial(Component().start)) == "Component.start"
+    assert describe(len) == "len"
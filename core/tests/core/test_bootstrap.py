@@ -1,6 +1,13 @@
+import json
+import logging
 from collections import OrderedDict
+from functools import partial
+from pathlib import Path
 
-from alleycat.core import Bootstrap
+from dependency_injector.providers import Configuration
+from pytest import approx, fixture
+
+from alleycat.core import Bootstrap, Feature, bootstrap
 
 
 def test_on_ready():
@@ -22,3 +29,130 @@ def test_on_ready():
     Bootstrap.when_ready(when_ready)
 
     assert count[0] == 2
+
+
+@fixture
+def pending():
+    initialised = bootstrap._initialised
+
+    bootstrap._initialised = False
+
+    yield
+
+    bootstrap._initialised = initialised
+    bootstrap._on_ready_callbacks.clear()
+
+
+def test_start_priority(pending):
+    started = []
+
+    Bootstrap.when_ready(lambda: started.append("normal"))
+    Bootstrap.when_ready(lambda: started.append("low"), -10)
+    Bootstrap.when_ready(lambda: started.append("critical"), 100)
+    Bootstrap.when_ready(lambda: started.append("normal2"))
+
+    Bootstrap().start(OrderedDict((('key', 'alleycat'), ('config', '//config.json'))))
+
+    assert started == ["critical", "normal", "normal2", "low"]
+
+
+def test_deferred_start(pending):
+    started = []
+    progress = []
+
+    for i in range(3):
+        Bootstrap.when_ready(partial(started.append, i))
+
+    time = [0.]
+
+    def timer() -> float:
+        time[0] += 1.
+        return time[0]
+
+    instance = Bootstrap()
+    instance.timer = timer
+
+    instance.start(OrderedDict((('key', 'alleycat'), ('config', '//config.json'), ('start_budget', 1.))))
+
+    subscription = Bootstrap.on_progress().subscribe(lambda p: progress.append((p.started, p.total, p.ratio)))
+
+    assert started == []
+    assert progress == [(0, 3, 0.)]
+    assert not bootstrap._initialised
+
+    instance.update()
+
+    assert started == [0]
+    assert progress[-1] == (1, 3, approx(1 / 3))
+
+    instance.update()
+    instance.update()
+
+    assert started == [0, 1, 2]
+    assert progress[-1] == (3, 3, 1.)
+    assert bootstrap._initialised
+
+    instance.update()
+
+    assert len(progress) == 4
+
+    subscription.dispose()
+
+
+def test_startup_profile(pending, tmp_path: Path, caplog):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"key": "value"}))
+
+    trace_file = tmp_path / "trace.json"
+
+    class Component:
+        def start(self) -> None:
+            pass
+
+    Bootstrap.when_ready(Component().start)
+    Bootstrap.when_ready(partial(Component().start))
+
+    with caplog.at_level(logging.INFO):
+        Bootstrap().start(OrderedDict((
+            ('key', 'alleycat'),
+            ('config', str(config_file)),
+            ('profile', str(trace_file)))))
+
+    trace = json.loads(trace_file.read_text())
+    events = trace["traceEvents"]
+
+    assert [(e["name"], e["cat"], e["ph"]) for e in events] == [
+        ("config.json", "config", "X"),
+        ("Component.start", "start", "X"),
+        ("Component.start", "start", "X")
+    ]
+
+    assert all(e["dur"] >= 0 for e in events)
+    assert events[0]["ts"] == 0
+
+    assert any(m.startswith("Startup took ") and "start: " in m for m in caplog.messages)
+
+
+def test_configure_features(pending, tmp_path: Path, caplog):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"greeting": "hello"}))
+
+    configured = []
+
+    class Greeter(Feature):
+        def config(self, config: Configuration):
+            configured.append(config.greeting())
+
+    class Broken(Feature):
+        def config(self, config: Configuration):
+            raise ValueError("Boom!")
+
+    instance = Bootstrap()
+    instance.components = [Greeter(), Broken()]
+
+    with caplog.at_level(logging.INFO):
+        instance.start(OrderedDict((('key', 'alleycat'), ('config', str(config_file)))))
+
+    assert configured == ["hello"]
+    assert "Configuring feature Greeter." in caplog.messages
+    assert "Failed to initialise feature." in caplog.messages
@@ -0,0 +1,104 @@
+import json
+import os
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from alleycat.core import cache_path_of, load_config
+
+CONFIG = {"input": {"actions": {"fire": [{"key": "SPACEKEY"}]}}, "items": [1, 2.5, "sword", None, True]}
+
+
+def test_load_without_cache(tmp_path: Path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(CONFIG))
+
+    assert load_config(config_file) == CONFIG
+    assert not cache_path_of(config_file).exists()
+
+
+def test_load_with_cache(tmp_path: Path, mocker: MockerFixture):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(CONFIG))
+
+    cache_file = cache_path_of(config_file)
+
+    assert cache_file == tmp_path / "config.json.cache"
+
+    assert load_config(config_file, cache_file) == CONFIG
+    assert cache_file.exists()
+
+    parse = mocker.patch("alleycat.core.config.json.loads")
+
+    assert load_config(config_file, cache_file) == CONFIG
+
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_config(config_file, cache_file) == CONFIG
+
+    parse.assert_not_called()
+
+    mocker.stopall()
+
+    modified = dict(CONFIG, version=2)
+
+    config_file.write_text(json.dumps(modified))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+    assert load_config(config_file, cache_file) == modified
+
+
+def test_invalid_cache(tmp_path: Path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(CONFIG))
+
+    cache_file = cache_path_of(config_file)
+    cache_file.write_bytes(b"garbage")
+
+    assert load_config(config_file, cache_file) == CONFIG
+    assert load_config(config_file, cache_file) == CONFIG
+
+
+def test_corrupt_cache(tmp_path: Path):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(CONFIG))
+
+    cache_file = cache_path_of(config_file)
+
+    assert load_config(config_file, cache_file) == CONFIG
+
+    valid = cache_file.read_bytes()
+
+    for payload in (valid[:-3], valid[:-3] + b"\xff\xff\xff"):
+        cache_file.write_bytes(payload)
+
+        assert load_config(config_file, cache_file) == CONFIG
+        assert cache_file.read_bytes() == valid
+
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    cache_file.write_bytes(valid[:-3])
+
+    assert load_config(config_file, cache_file) == CONFIG
+    assert load_config(config_file, cache_file) == CONFIG
+
+
+def test_cache_from_other_interpreter(tmp_path: Path, mocker: MockerFixture):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(CONFIG))
+
+    cache_file = cache_path_of(config_file)
+
+    mocker.patch("alleycat.core.config.MAGIC_NUMBER", b"\x00\x00\r\n")
+
+    assert load_config(config_file, cache_file) == CONFIG
+
+    mocker.stopall()
+
+    loads = mocker.spy(json, "loads")
+
+    assert load_config(config_file, cache_file) == CONFIG
+
+    loads.assert_called_once()
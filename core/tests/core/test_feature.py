@@ -0,0 +1,115 @@
+import logging
+from threading import Event, current_thread, main_thread
+from typing import List
+
+from dependency_injector.providers import Configuration
+
+from alleycat.core import Feature, configure_features
+
+logger = logging.getLogger(__name__)
+
+
+class Recorder(Feature):
+    def __init__(self, calls: List[str]) -> None:
+        self.calls = calls
+        self.threads = []
+
+    def load(self, config: Configuration) -> None:
+        self.threads.append(current_thread())
+
+    def config(self, config: Configuration):
+        self.threads.append(current_thread())
+        self.calls.append(type(self).__name__)
+
+
+class Storage(Recorder):
+    pass
+
+
+class Assets(Recorder):
+    pass
+
+
+class World(Recorder):
+    dependencies = (Storage, Assets)
+
+
+class Broken(Recorder):
+    def load(self, config: Configuration) -> None:
+        raise ValueError("Boom!")
+
+
+class Dependent(Recorder):
+    dependencies = (Broken,)
+
+
+class Missing(Recorder):
+    dependencies = (Dependent,)
+
+
+class Cyclic(Recorder):
+    pass
+
+
+class Cyclic2(Recorder):
+    dependencies = (Cyclic,)
+
+
+Cyclic.dependencies = (Cyclic2,)
+
+
+def test_dependency_order():
+    calls = []
+
+    world = World(calls)
+    storage = Storage(calls)
+
+    configure_features((world, Assets(calls), storage), Configuration(), logger)
+
+    assert calls.index("World") == 2
+    assert set(calls[:2]) == {"Storage", "Assets"}
+
+    assert storage.threads[0] is not main_thread()
+    assert storage.threads[1] is main_thread()
+
+
+def test_concurrent_load():
+    loaded = Event()
+
+    class First(Recorder):
+        def load(self, config: Configuration) -> None:
+            assert loaded.wait(5)
+
+    class Second(Recorder):
+        def load(self, config: Configuration) -> None:
+            loaded.set()
+
+    calls = []
+
+    configure_features((First(calls), Second(calls)), Configuration(), logger)
+
+    assert sorted(calls) == ["First", "Second"]
+
+
+def test_failures(caplog):
+    calls = []
+
+    features = (Broken(calls), Dependent(calls), Cyclic(calls), Cyclic2(calls), Storage(calls))
+
+    configure_features(features, Configuration(), logger)
+
+    assert calls == ["Storage"]
+
+    messages = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+
+    assert "Failed to initialise feature." in messages
+    assert "Skipping feature Dependent because one of its dependencies failed." in messages
+    assert "Skipping feature Cyclic because of a circular dependency." in messages
+
+    calls.clear()
+    caplog.clear()
+
+    configure_features((Missing(calls), Storage(calls)), Configuration(), logger)
+
+    assert calls == ["Storage"]
+    assert "Missing dependency Dependent for feature Missing." in caplog.messages
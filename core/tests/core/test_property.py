@@ -299,3 +299,35 @@ def test_read_only():
 
     with raises(AttributeError):
         comp.float_value = 2.0
+
+
+def test_reset():
+    def create_args(value: str) -> OrderedDict:
+        return OrderedDict((
+            ("String Value", value),
+            ("Bool Value", False),
+            ("Int Value", 321),
+            ("Float Value", 1.5),
+            ("Object Value", KX_GameObject()),
+            ("Data Value", Camera()),
+        ))
+
+    comp = TestComp()
+    comp.start(create_args("XYZ"))
+
+    assert comp.string_value == "XYZ"
+
+    comp.dispose()
+    comp._reset()
+
+    comp.assert_exception(RESULT_NOT_STARTED.failure())
+
+    values = []
+
+    comp.on_property_change("string_value").subscribe(values.append)
+    comp.start(create_args("DEF"))
+
+    assert comp.string_value == "DEF"
+    assert values == ["DEF"]
+
+    comp.dispose()
@@ -1,10 +1,14 @@
 import asyncio
+import gc
+import threading
+import time
 from typing import Any, OrderedDict
 
 import trio
-from pytest import mark
+from pytest import mark, raises
 
 from alleycat.event import CoroutineRunner
+from alleycat.lifecycle import AlreadyDisposedError
 
 
 @mark.asyncio
@@ -30,3 +34,183 @@ async def test_coroutine_runner():
         await asyncio.sleep(0.1)
 
     assert events == [1, 2, 3]
+
+    runner.dispose()
+
+    assert runner.is_disposed
+
+
+@mark.asyncio
+async def test_profiling():
+    async def callback():
+        for _ in range(3):
+            time.sleep(0.01)
+            await trio.sleep(0.05)
+
+    runner = CoroutineRunner(profile=True)
+
+    assert runner.profiling
+
+    runner.update()
+    runner.run_async(callback, name="test")
+
+    for _ in range(1, 10):
+        runner.update()
+        await asyncio.sleep(0.05)
+
+    stats = runner.stats
+
+    assert set(stats.keys()) == {"test"}
+
+    assert stats["test"].name == "test"
+    assert stats["test"].steps == 4
+    assert stats["test"].max_time >= 0.01
+    assert stats["test"].total_time >= 0.03
+    assert stats["test"].mean_time == stats["test"].total_time / 4
+    assert stats["test"].wait_time >= 0.15
+
+    runner.reset_stats()
+
+    assert runner.stats == dict()
+
+    runner.dispose()
+
+
+@mark.filterwarnings("ignore::RuntimeWarning", "ignore::pytest.PytestUnraisableExceptionWarning")
+def test_shutdown_timeout():
+    with raises(ValueError, match="Shutdown timeout must be zero or a positive number"):
+        CoroutineRunner(shutdown_timeout=-1)
+
+    async def stubborn():
+        with trio.CancelScope(shield=True):
+            await trio.sleep(0.2)
+
+    elapsed = []
+
+    def run():
+        runner = CoroutineRunner(shutdown_timeout=0.05)
+
+        runner.update()
+        runner.run_async(stubborn)
+
+        for _ in range(3):
+            runner.update()
+            time.sleep(0.01)
+
+        start = time.perf_counter()
+
+        runner.dispose()
+
+        elapsed.append(time.perf_counter() - start)
+
+    # The abandoned guest run stays bound to its host thread, so keep it off the test thread.
+    thread = threading.Thread(target=run)
+
+    thread.start()
+    thread.join()
+
+    assert len(elapsed) == 1
+    assert elapsed[0] < 0.2
+
+    time.sleep(0.3)
+    gc.collect()
+
+
+def test_without_profiling():
+    runner = CoroutineRunner()
+
+    assert not runner.profiling
+    assert runner.stats == dict()
+
+    runner.dispose()
+
+
+@mark.asyncio
+async def test_task_pool():
+    active = [0]
+    peak = [0]
+    completed = []
+
+    async def callback(index: int):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+
+        await trio.sleep(0.05)
+
+        active[0] -= 1
+        completed.append(index)
+
+    runner = CoroutineRunner()
+
+    pool = runner.create_pool("assets", max_concurrency=2)
+
+    assert runner.pools == {"assets": pool}
+
+    for i in range(5):
+        pool.run_async(callback, i)
+
+    assert pool.pending == 5
+    assert pool.running == 0
+
+    runner.update()
+
+    assert pool.pending == 3
+    assert pool.running == 2
+
+    for _ in range(1, 20):
+        runner.update()
+        await asyncio.sleep(0.05)
+
+    assert sorted(completed) == [0, 1, 2, 3, 4]
+    assert peak[0] == 2
+
+    assert pool.pending == 0
+    assert pool.running == 0
+
+    with raises(ValueError, match="Task pool 'assets' already exists."):
+        runner.create_pool("assets", max_concurrency=1)
+
+    runner.dispose()
+
+    with raises(AlreadyDisposedError):
+        pool.run_async(callback, 5)
+
+    assert pool.pending == 0
+
+
+@mark.asyncio
+async def test_task_pool_priority():
+    started = []
+
+    async def callback(name: str):
+        started.append(name)
+
+    runner = CoroutineRunner(max_starts_per_update=2)
+
+    low = runner.create_pool("low", max_concurrency=5, priority=0)
+    high = runner.create_pool("high", max_concurrency=5, priority=10)
+
+    for i in range(3):
+        low.run_async(callback, f"low{i}")
+        high.run_async(callback, f"high{i}")
+
+    runner.update()
+
+    assert high.pending == 1
+    assert low.pending == 3
+
+    runner.update()
+
+    assert high.pending == 0
+    assert low.pending == 2
+
+    for _ in range(1, 5):
+        runner.update()
+        await asyncio.sleep(0.05)
+
+    assert high.pending == 0
+    assert low.pending == 0
+
+    assert sorted(started) == ["high0", "high1", "high2", "low0", "low1", "low2"]
+
+    runner.dispose()
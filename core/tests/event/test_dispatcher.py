@@ -0,0 +1,248 @@
+from datetime import timedelta
+from typing import List
+
+import bge
+from pytest import raises
+from reactivex import Subject
+
+from alleycat.event import EventLoopScheduler, TimeMode, UpdateDispatcher
+from alleycat.lifecycle import Updatable
+
+
+class Recorder(Updatable):
+    def __init__(self, name: str, calls: List[str], enabled: bool = True) -> None:
+        self.name = name
+        self.calls = calls
+        self.enabled = enabled
+
+    @property
+    def can_update(self) -> bool:
+        return self.enabled
+
+    def _do_update(self) -> None:
+        self.calls.append(self.name)
+
+
+def test_update_order():
+    calls = []
+
+    dispatcher = UpdateDispatcher()
+
+    late = Recorder("late", calls)
+    first = Recorder("first", calls)
+    second = Recorder("second", calls)
+    input_ = Recorder("input", calls)
+
+    dispatcher.register(late, -10)
+    dispatcher.register(first)
+    dispatcher.register(second)
+    dispatcher.register(input_, 100)
+
+    assert len(dispatcher) == 4
+    assert first in dispatcher
+
+    dispatcher.update()
+
+    assert calls == ["input", "first", "second", "late"]
+
+    with raises(ValueError, match="The object has already been registered"):
+        dispatcher.register(first)
+
+    dispatcher.dispose()
+
+
+def test_unregister():
+    calls = []
+
+    dispatcher = UpdateDispatcher()
+
+    first = Recorder("first", calls)
+    second = Recorder("second", calls)
+
+    registration = dispatcher.register(first)
+
+    dispatcher.register(second)
+    dispatcher.update()
+
+    registration.dispose()
+
+    assert first not in dispatcher
+
+    dispatcher.update()
+
+    assert calls == ["first", "second", "second"]
+    assert not dispatcher.unregister(first)
+
+    dispatcher.dispose()
+
+
+def test_sleep():
+    calls = []
+
+    dispatcher = UpdateDispatcher()
+
+    first = Recorder("first", calls)
+    second = Recorder("second", calls, enabled=False)
+
+    dispatcher.register(first)
+    dispatcher.register(second)
+
+    dispatcher.sleep(first)
+    dispatcher.update()
+
+    assert dispatcher.is_sleeping(first)
+    assert dispatcher.active == 1
+    assert calls == []
+
+    dispatcher.wake(first)
+    dispatcher.update()
+
+    assert calls == ["first"]
+
+    with raises(ValueError, match="The object has not been registered"):
+        dispatcher.sleep(Recorder("unknown", calls))
+
+    with raises(ValueError, match="A scheduler is required to sleep until the given time."):
+        dispatcher.sleep(first, due=1.)
+
+    dispatcher.dispose()
+
+
+def test_sleep_until():
+    calls = []
+
+    dispatcher = UpdateDispatcher()
+
+    first = Recorder("first", calls)
+    second = Recorder("second", calls)
+
+    dispatcher.register(first)
+    dispatcher.register(second)
+
+    alarm = Subject[int]()
+
+    dispatcher.sleep(first, until=alarm)
+    dispatcher.update()
+
+    assert calls == ["second"]
+
+    alarm.on_next(1)
+
+    assert not dispatcher.is_sleeping(first)
+
+    dispatcher.update()
+
+    assert calls == ["second", "second", "first"]
+
+    dispatcher.sleep(first, until=alarm)
+    dispatcher.wake(first)
+
+    dispatcher.sleep(first)
+
+    alarm.on_next(2)
+
+    assert dispatcher.is_sleeping(first)
+
+    dispatcher.dispose()
+
+
+def test_sleep_until_time():
+    bge.logic.setClockTime(0.)
+
+    calls = []
+
+    scheduler = EventLoopScheduler(mode=TimeMode.Clock)
+    dispatcher = UpdateDispatcher(scheduler=scheduler)
+
+    first = Recorder("first", calls)
+
+    dispatcher.register(first)
+    dispatcher.sleep(first, due=timedelta(seconds=2))
+
+    for time in (0.5, 1., 1.5):
+        bge.logic.setClockTime(time)
+
+        scheduler.process()
+        dispatcher.update()
+
+    assert calls == []
+    assert dispatcher.active == 0
+
+    bge.logic.setClockTime(2.5)
+
+    scheduler.process()
+    dispatcher.update()
+
+    assert calls == ["first"]
+    assert dispatcher.active == 1
+
+    bge.logic.setClockTime(0.)
+
+    dispatcher.dispose()
+    scheduler.dispose()
+
+
+def test_profiling():
+    calls = []
+
+    class Failing(Updatable):
+        def _do_update(self) -> None:
+            raise ValueError("Boom!")
+
+    dispatcher = UpdateDispatcher(profile=True)
+
+    dispatcher.register(Recorder("a", calls), name="npc")
+    dispatcher.register(Recorder("b", calls), name="npc")
+    dispatcher.register(Failing())
+
+    for _ in range(3):
+        dispatcher.update()
+
+    assert calls == ["a", "b"] * 3
+
+    stats = dispatcher.stats
+
+    assert set(stats.keys()) == {"npc", "Failing"}
+    assert stats["npc"].steps == 6
+    assert stats["Failing"].steps == 3
+    assert stats["npc"].total_time > 0
+    assert stats["npc"].max_time <= stats["npc"].total_time
+
+    dispatcher.reset_stats()
+
+    assert dispatcher.stats["npc"].steps == 0
+
+    assert UpdateDispatcher().stats == dict()
+
+    dispatcher.dispose()
+
+
+def test_register_during_update():
+    calls = []
+
+    dispatcher = UpdateDispatcher()
+
+    class Spawner(Recorder):
+        def _do_update(self) -> None:
+            super()._do_update()
+
+            if len(calls) == 1:
+                dispatcher.register(Recorder("lowest", calls), -10)
+                dispatcher.register(Recorder("highest", calls), 10)
+                dispatcher.wake(sleeper)
+
+    sleeper = Recorder("sleeper", calls)
+
+    dispatcher.register(Spawner("low", calls), -5)
+    dispatcher.register(sleeper, -5)
+
+    dispatcher.sleep(sleeper)
+    dispatcher.update()
+
+    assert calls == ["low"]
+
+    dispatcher.update()
+
+    assert calls == ["low", "highest", "low", "sleeper", "lowest"]
+
+    dispatcher.dispose()
@@ -0,0 +1,94 @@
+import trio
+from pytest import mark, raises
+from reactivex import Subject
+
+from alleycat.event import ObservableIterator, OverflowPolicy
+
+
+async def collect(iterator: ObservableIterator[int]):
+    return [v async for v in iterator]
+
+
+@mark.parametrize("policy, expected", (
+        (OverflowPolicy.DropOldest, [3, 4, 5]),
+        (OverflowPolicy.DropNewest, [1, 2, 3]),
+        (OverflowPolicy.Latest, [4, 5])))
+def test_overflow_policy(policy: OverflowPolicy, expected):
+    subject = Subject[int]()
+
+    iterator = ObservableIterator(subject, buffer_size=3, policy=policy)
+
+    for value in range(1, 6):
+        subject.on_next(value)
+
+    subject.on_completed()
+
+    assert trio.run(collect, iterator) == expected
+
+
+def test_iteration():
+    subject = Subject[int]()
+
+    iterator = ObservableIterator(subject, buffer_size=2)
+
+    results = []
+
+    async def consume():
+        async for v in iterator:
+            results.append(v)
+
+    async def produce():
+        for value in range(1, 4):
+            subject.on_next(value)
+            await trio.sleep(0.01)
+
+        subject.on_completed()
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(consume)
+            nursery.start_soon(produce)
+
+    trio.run(main)
+
+    assert results == [1, 2, 3]
+
+
+def test_error():
+    subject = Subject[int]()
+
+    iterator = ObservableIterator(subject, buffer_size=2, policy=OverflowPolicy.DropOldest)
+
+    subject.on_next(1)
+    subject.on_error(ValueError("Something bad happened!"))
+
+    results = []
+
+    async def consume():
+        async for v in iterator:
+            results.append(v)
+
+    with raises(ValueError, match="Something bad happened!"):
+        trio.run(consume)
+
+    assert results == [1]
+
+
+def test_dispose():
+    subject = Subject[int]()
+
+    iterator = ObservableIterator(subject, buffer_size=2)
+
+    subject.on_next(1)
+
+    iterator.dispose()
+
+    subject.on_next(2)
+
+    assert trio.run(collect, iterator) == []
+    assert iterator.is_disposed
+
+
+def test_invalid_buffer_size():
+    with raises(ValueError, match="Buffer size must be a positive integer"):
+        ObservableIterator(Subject[int](), buffer_size=0)
@@ -0,0 +1,86 @@
+from typing import List
+
+import bge
+from pytest import approx, raises
+
+from alleycat.event import ShardedUpdateGroup, TimeMode
+from alleycat.lifecycle import TimedUpdatable
+
+
+class Npc(TimedUpdatable):
+    def __init__(self, name: str, calls: List[str]) -> None:
+        self.name = name
+        self.calls = calls
+        self.times: List[float] = []
+
+    def _do_update(self) -> None:
+        self.calls.append(self.name)
+        self.times.append(self.elapsed)
+
+
+def test_sharded_update():
+    bge.logic.setClockTime(0.)
+
+    calls = []
+
+    group = ShardedUpdateGroup(3, TimeMode.Clock)
+
+    npcs = [Npc(str(i), calls) for i in range(7)]
+
+    for npc in npcs:
+        group.add(npc)
+
+    assert len(group) == 7
+    assert [group.shard_of(n) for n in npcs] == [0, 1, 2, 0, 1, 2, 0]
+
+    for frame in range(1, 7):
+        bge.logic.setClockTime(frame * 0.5)
+        group.update()
+
+    assert calls == ["0", "3", "6", "1", "4", "2", "5"] * 2
+
+    assert npcs[0].times == approx([0.5, 1.5])
+    assert npcs[1].times == approx([1.0, 1.5])
+    assert npcs[2].times == approx([1.5, 1.5])
+
+    with raises(ValueError, match="The object is already a member of the group"):
+        group.add(npcs[0])
+
+    bge.logic.setClockTime(0.)
+
+    group.dispose()
+
+
+def test_rebalance():
+    bge.logic.setClockTime(0.)
+
+    calls = []
+
+    group = ShardedUpdateGroup(2, TimeMode.Clock)
+
+    npcs = [Npc(str(i), calls) for i in range(4)]
+    registrations = [group.add(n) for n in npcs]
+
+    registrations[0].dispose()
+
+    assert npcs[0] not in group
+    assert not group.remove(npcs[0])
+
+    assert len(group) == 3
+    assert [group.shard_of(n) for n in npcs[1:]] == [1, 0, 0]
+
+    group.update()
+
+    assert calls == ["3", "2"]
+
+    calls.clear()
+
+    group.remove(npcs[2])
+    group.update()
+
+    assert calls == ["1"]
+
+    with raises(ValueError, match="The object is not a member of the group"):
+        group.shard_of(npcs[2])
+
+    group.dispose()
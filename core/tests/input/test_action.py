@@ -0,0 +1,156 @@
+from collections import OrderedDict
+
+from bge.events import AKEY, DKEY, LEFTMOUSE, SPACEKEY
+from bge.logic import KX_INPUT_ACTIVE, keyboard, mouse
+from dependency_injector.providers import Configuration
+from pytest import approx, fixture, raises
+
+from alleycat.core import bootstrap
+from alleycat.input import ActionInputSource, ActionMap, KeyboardInputSource, MouseInputSource
+from alleycat.lifecycle import ObjectPool
+from alleycat.test.mock_bge import SCA_InputEvent
+
+BINDINGS = {
+    "fire": [{"mouse": "LEFT"}, {"key": "SPACEKEY"}],
+    "move_x": [{"key": "DKEY"}, {"key": "AKEY", "scale": -1}],
+    "look_x": [{"axis": "x", "scale": 2}]
+}
+
+PRESSED = SCA_InputEvent((KX_INPUT_ACTIVE,))
+
+
+def setup():
+    bootstrap._initialised = True
+
+
+def teardown():
+    bootstrap._initialised = False
+
+
+@fixture
+def sources():
+    mouse.position = (0.5, 0.5)
+    mouse.activeInputs = {}
+
+    keyboard.activeInputs = {}
+
+    mouse_source = MouseInputSource()
+    keyboard_source = KeyboardInputSource()
+
+    mouse_source.start(OrderedDict(()))
+    keyboard_source.start(OrderedDict(()))
+
+    yield mouse_source, keyboard_source
+
+    mouse_source.dispose()
+    keyboard_source.dispose()
+
+
+def test_from_config():
+    config = Configuration()
+    config.from_dict({"input": {"actions": BINDINGS}})
+
+    actions = ActionMap.from_config(config)
+
+    assert actions.names == ("fire", "move_x", "look_x")
+    assert actions.indices == {"fire": 0, "move_x": 1, "look_x": 2}
+
+    assert ActionMap.from_config(Configuration()).names == ()
+
+
+def test_invalid_bindings():
+    with raises(ValueError, match="Unknown key 'NOKEY' for action 'fire'."):
+        ActionMap.compile({"fire": [{"key": "NOKEY"}]})
+
+    with raises(ValueError, match="Unknown mouse button 'BACK' for action 'fire'."):
+        ActionMap.compile({"fire": [{"mouse": "BACK"}]})
+
+    with raises(ValueError, match="Unknown axis 'z' for action 'look'."):
+        ActionMap.compile({"look": [{"axis": "z"}]})
+
+    with raises(ValueError, match="Invalid binding for action 'jump'"):
+        ActionMap.compile({"jump": [{"gamepad": "A"}]})
+
+
+def test_action_state(sources):
+    (mouse_source, keyboard_source) = sources
+
+    source = ActionInputSource(ActionMap.compile(BINDINGS), mouse_source, keyboard_source)
+
+    states = []
+
+    source.on_state_change.subscribe(states.append)
+    source.start(OrderedDict(()))
+
+    def update():
+        mouse_source.update()
+        keyboard_source.update()
+
+        source.update()
+
+    update()
+
+    assert len(states) == 1
+    assert states[-1].values == (0., 0., 0.)
+    assert not states[-1].pressed("fire")
+
+    mouse.activeInputs = {LEFTMOUSE: PRESSED}
+    keyboard.activeInputs = {SPACEKEY: PRESSED, AKEY: PRESSED}
+
+    update()
+
+    assert len(states) == 2
+    assert states[-1].pressed("fire")
+    assert states[-1]["fire"] == 1.
+    assert states[-1]["move_x"] == -1.
+
+    keyboard.activeInputs = {SPACEKEY: PRESSED, AKEY: PRESSED, DKEY: PRESSED}
+
+    update()
+
+    assert states[-1]["move_x"] == 0.
+    assert not states[-1].pressed("move_x")
+
+    update()
+
+    assert len(states) == 3
+
+    mouse.position = (0.6, 0.5)
+
+    update()
+
+    assert states[-1]["look_x"] == approx(0.2)
+
+    update()
+
+    assert states[-1]["look_x"] == 0.
+    assert len(states) == 5
+
+    source.dispose()
+
+
+def test_pooled(sources):
+    (mouse_source, keyboard_source) = sources
+
+    pool = ObjectPool(lambda: ActionInputSource(ActionMap.compile(BINDINGS), mouse_source, keyboard_source))
+
+    source = pool.acquire(OrderedDict(()))
+
+    mouse_source.update()
+    source.update()
+
+    assert pool.release(source)
+
+    mouse.position = (0.7, 0.5)
+    mouse_source.update()
+
+    assert pool.acquire(OrderedDict(())) is source
+
+    states = []
+
+    source.on_state_change.subscribe(states.append)
+    source.update()
+
+    assert states[-1]["look_x"] == 0.
+
+    source.dispose()
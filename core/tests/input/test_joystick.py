@@ -0,0 +1,185 @@
+from collections import OrderedDict
+
+import bge
+from pytest import approx, fixture
+
+from alleycat.core import bootstrap
+from alleycat.input import JoystickButtonDownEvent, JoystickButtonUpEvent, JoystickInputSource
+from alleycat.lifecycle import ObjectPool
+from alleycat.test.mock_bge import SCA_PythonJoystick
+
+ARGS = OrderedDict((
+    ("Dead Zone", 0.2),
+    ("Response Curve", 2.0),
+    ("Threshold", 0.05),
+))
+
+
+def setup():
+    bootstrap._initialised = True
+
+
+def teardown():
+    bootstrap._initialised = False
+
+
+@fixture
+def joystick() -> SCA_PythonJoystick:
+    joystick = SCA_PythonJoystick()
+    joystick.axisValues = [0.] * 4
+    joystick.activeButtons = []
+
+    bge.logic.joysticks[1] = joystick
+
+    yield joystick
+
+    bge.logic.joysticks[1] = None
+
+
+def test_axes(joystick: SCA_PythonJoystick):
+    comp = JoystickInputSource()
+
+    states = []
+
+    comp.on_state_change.subscribe(states.append)
+    comp.start(ARGS)
+
+    comp.update()
+
+    assert len(states) == 1
+    assert states[-1].is_connected(1)
+    assert not states[-1].is_connected(0)
+    assert states[-1].axes == (0.,) * len(states[-1].axes)
+
+    joystick.axisValues = [0.15, -0.1, 0., 0.]
+
+    comp.update()
+
+    assert len(states) == 1
+
+    joystick.axisValues = [0.6, 0., 0., -1.0]
+
+    comp.update()
+
+    assert len(states) == 2
+    assert states[-1].axis(1, 0) == approx(0.25)
+    assert states[-1].axis(1, 1) == 0.
+    assert states[-1].axis(1, 3) == approx(-1.0)
+
+    joystick.axisValues = [0.62, 0., 0., -1.0]
+
+    comp.update()
+
+    assert len(states) == 2
+
+    joystick.axisValues = [0.18, 0.18, 0., 0.]
+
+    comp.update()
+
+    assert len(states) == 3
+    assert states[-1].axis(1, 0) > 0.
+    assert states[-1].axis(1, 0) == approx(states[-1].axis(1, 1))
+
+    joystick.axisValues = [0.5, -0.5, 0., 0.]
+
+    comp.update()
+
+    expected = ((0.5 ** 0.5 - 0.2) / 0.8) ** 2 * 0.5 ** 0.5
+
+    assert len(states) == 4
+    assert states[-1].axis(1, 0) == approx(expected)
+    assert states[-1].axis(1, 1) == approx(-expected)
+
+    joystick.axisValues = [1.0, 1.0, 0., 0.]
+
+    comp.update()
+
+    assert len(states) == 5
+    assert states[-1].axis(1, 0) == approx(0.5 ** 0.5)
+    assert states[-1].axis(1, 1) == approx(0.5 ** 0.5)
+
+    bge.logic.joysticks[1] = None
+
+    comp.update()
+
+    assert len(states) == 6
+    assert not states[-1].is_connected(1)
+    assert states[-1].axis(1, 0) == 0.
+
+    comp.dispose()
+
+
+def test_buttons(joystick: SCA_PythonJoystick):
+    comp = JoystickInputSource()
+
+    events = []
+
+    comp.on_button_down.subscribe(events.append)
+    comp.on_button_up.subscribe(events.append)
+
+    comp.start(ARGS)
+
+    comp.update()
+
+    joystick.activeButtons = [0, 3]
+
+    comp.update()
+
+    state = comp.state.unwrap()
+
+    assert state.pressed(1, 0)
+    assert state.pressed(1, 3)
+    assert not state.pressed(1, 1)
+
+    assert events == [
+        JoystickButtonDownEvent(comp, state, 1, 0),
+        JoystickButtonDownEvent(comp, state, 1, 3)
+    ]
+
+    joystick.activeButtons = [3]
+
+    comp.update()
+
+    assert events[2:] == [JoystickButtonUpEvent(comp, comp.state.unwrap(), 1, 0)]
+
+    comp.dispose()
+
+
+def test_pooled(joystick: SCA_PythonJoystick):
+    pool = ObjectPool(JoystickInputSource)
+
+    comp = pool.acquire(ARGS)
+
+    joystick.activeButtons = [2]
+
+    comp.update()
+
+    assert pool.release(comp)
+    assert pool.acquire(ARGS) is comp
+
+    events = []
+
+    comp.on_button_down.subscribe(events.append)
+
+    comp.update()
+
+    assert events == [JoystickButtonDownEvent(comp, comp.state.unwrap(), 1, 2)]
+
+    comp.dispose()
+
+
+def test_invalid_args(joystick: SCA_PythonJoystick):
+    joystick.axisValues = [0.5, 0., 0., 0.]
+
+    for (key, value, message) in (
+            ("Dead Zone", 1.0, "Dead zone must be in the range [0, 1) (found: 1.0)."),
+            ("Dead Zone", -0.1, "Dead zone must be in the range [0, 1) (found: -0.1)."),
+            ("Response Curve", 0., "Response curve must be a positive number (found: 0.0).")):
+        comp = JoystickInputSource()
+        comp.start(OrderedDict(ARGS, **{key: value}))
+
+        comp.update()
+
+        assert str(comp.state.failure()) == message
+
+        comp.dispose()
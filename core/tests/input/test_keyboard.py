@@ -0,0 +1,173 @@
+from collections import OrderedDict
+
+from _pytest.fixtures import fixture
+from bge.events import AKEY, BKEY, SPACEKEY
+from bge.logic import KX_INPUT_ACTIVE, KX_INPUT_JUST_RELEASED
+from bge.types import SCA_PythonKeyboard
+from returns.result import Result
+
+from alleycat.core import bootstrap
+from alleycat.input import KeyDownEvent, KeyUpEvent, KeyboardInputSource, KeyboardState
+from alleycat.lifecycle import ObjectPool, RESULT_DISPOSED, RESULT_NOT_STARTED
+from alleycat.test.mock_bge import SCA_InputEvent
+
+
+def setup():
+    bootstrap._initialised = True
+
+
+def teardown():
+    bootstrap._initialised = False
+
+
+@fixture
+def keyboard() -> SCA_PythonKeyboard:
+    from bge.logic import keyboard
+
+    keyboard.activeInputs = {}
+
+    return keyboard
+
+
+def test_keyboard_state():
+    state = KeyboardState.from_keys((AKEY, SPACEKEY))
+
+    assert state.key_mask == (1 << AKEY) | (1 << SPACEKEY)
+    assert state.keys == {AKEY, SPACEKEY}
+
+    assert state.pressed(AKEY)
+    assert state.pressed(SPACEKEY)
+    assert not state.pressed(BKEY)
+
+    assert KeyboardState(0).keys == set()
+
+
+def test_state(keyboard: SCA_PythonKeyboard):
+    comp = KeyboardInputSource()
+
+    def state_of(*keys):
+        return Result.from_value(KeyboardState.from_keys(keys))
+
+    assert comp.state == RESULT_NOT_STARTED
+
+    comp.start(OrderedDict(()))
+
+    assert comp.state == state_of()
+
+    keyboard.activeInputs = {
+        AKEY: SCA_InputEvent((KX_INPUT_ACTIVE,)),
+        BKEY: SCA_InputEvent((KX_INPUT_ACTIVE,))
+    }
+
+    comp.update()
+
+    assert comp.state == state_of(AKEY, BKEY)
+
+    keyboard.activeInputs = {
+        AKEY: SCA_InputEvent((KX_INPUT_ACTIVE,)),
+        BKEY: SCA_InputEvent((KX_INPUT_JUST_RELEASED,))
+    }
+
+    comp.update()
+
+    assert comp.state == state_of(AKEY)
+
+    comp.dispose()
+
+    assert comp.state == RESULT_DISPOSED
+
+
+def test_key_events(keyboard: SCA_PythonKeyboard):
+    comp = KeyboardInputSource()
+
+    data = {
+        "down": [],
+        "up": [],
+        "pressed": [],
+        "released": [],
+        "completed": 0
+    }
+
+    def on_completed():
+        data["completed"] += 1
+
+    comp.on_key_down.subscribe(data["down"].append, on_completed=on_completed)
+    comp.on_key_up.subscribe(data["up"].append, on_completed=on_completed)
+
+    comp.on_key_press(AKEY).subscribe(data["pressed"].append, on_completed=on_completed)
+    comp.on_key_release(AKEY).subscribe(data["released"].append, on_completed=on_completed)
+
+    comp.start(OrderedDict(()))
+
+    comp.update()
+
+    assert data["down"] == []
+    assert data["up"] == []
+
+    keyboard.activeInputs = {
+        AKEY: SCA_InputEvent((KX_INPUT_ACTIVE,)),
+        BKEY: SCA_InputEvent((KX_INPUT_ACTIVE,))
+    }
+
+    comp.update()
+
+    state1 = KeyboardState.from_keys((AKEY, BKEY))
+
+    assert data["down"] == [KeyDownEvent(comp, state1, AKEY), KeyDownEvent(comp, state1, BKEY)]
+    assert data["up"] == []
+    assert data["pressed"] == [KeyDownEvent(comp, state1, AKEY)]
+    assert data["released"] == []
+
+    comp.update()
+
+    assert len(data["down"]) == 2
+
+    keyboard.activeInputs = {
+        BKEY: SCA_InputEvent((KX_INPUT_ACTIVE,)),
+        SPACEKEY: SCA_InputEvent((KX_INPUT_ACTIVE,))
+    }
+
+    comp.update()
+
+    state2 = KeyboardState.from_keys((BKEY, SPACEKEY))
+
+    assert data["down"] == [
+        KeyDownEvent(comp, state1, AKEY),
+        KeyDownEvent(comp, state1, BKEY),
+        KeyDownEvent(comp, state2, SPACEKEY)
+    ]
+    assert data["up"] == [KeyUpEvent(comp, state2, AKEY)]
+    assert data["pressed"] == [KeyDownEvent(comp, state1, AKEY)]
+    assert data["released"] == [KeyUpEvent(comp, state2, AKEY)]
+
+    assert data["completed"] == 0
+
+    comp.dispose()
+
+    assert data["completed"] == 4
+
+
+def test_pooled(keyboard: SCA_PythonKeyboard):
+    pool = ObjectPool(KeyboardInputSource)
+
+    comp = pool.acquire(OrderedDict(()))
+
+    keyboard.activeInputs = {AKEY: SCA_InputEvent((KX_INPUT_ACTIVE,))}
+
+    comp.update()
+
+    assert pool.release(comp)
+    assert pool.acquire(OrderedDict(())) is comp
+
+    events = []
+
+    comp.on_key_down.subscribe(events.append)
+    comp.on_key_press(AKEY).subscribe(events.append)
+
+    comp.update()
+
+    state = comp.state.unwrap()
+
+    assert events == [KeyDownEvent(comp, state, AKEY)] * 2
+
+    comp.dispose()
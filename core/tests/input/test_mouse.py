@@ -2,14 +2,14 @@ from collections import OrderedDict
 
 from _pytest.fixtures import fixture
 from bge.events import LEFTMOUSE, MIDDLEMOUSE
-from bge.logic import KX_INPUT_ACTIVE, KX_INPUT_JUST_RELEASED
+from bge.logic import KX_INPUT_ACTIVE, KX_INPUT_JUST_ACTIVATED, KX_INPUT_JUST_RELEASED
 from bge.types import SCA_PythonMouse
 from returns.result import Result
 
 from alleycat.common import Point2D
 from alleycat.core import bootstrap
 from alleycat.input import MouseButton, MouseDownEvent, MouseInputSource, MouseMoveEvent, MouseState, MouseUpEvent
-from alleycat.lifecycle import RESULT_DISPOSED, RESULT_NOT_STARTED
+from alleycat.lifecycle import ObjectPool, RESULT_DISPOSED, RESULT_NOT_STARTED
 from alleycat.test.mock_bge import SCA_InputEvent
 
 
@@ -35,7 +35,7 @@ def test_mouse_state(mouse: SCA_PythonMouse):
     comp = MouseInputSource()
 
     def state_of(x, y, *args):
-        return Result.from_value(MouseState(Point2D(x, y), set(args)))
+        return Result.from_value(MouseState.from_buttons(Point2D(x, y), args))
 
     assert comp.state == RESULT_NOT_STARTED
 
@@ -85,8 +85,8 @@ def test_on_mouse_move(mouse: SCA_PythonMouse):
     def on_completed():
         data["completed"] = True
 
-    def moved_to(x, y):
-        return MouseMoveEvent(comp, MouseState(Point2D(x, y), set()))
+    def moved_to(x, y, offset=Point2D(0, 0)):
+        return MouseMoveEvent(comp, MouseState(Point2D(x, y), 0), offset)
 
     with comp.on_mouse_move.subscribe(
             on_next=data["events"].append,
@@ -120,13 +120,52 @@ def test_on_mouse_move(mouse: SCA_PythonMouse):
 
         assert not data["completed"]
         assert data["errors"] == []
-        assert data["events"] == [moved_to(0.5, 0.5), moved_to(0.8, 0.3)]
+        assert data["events"] == [
+            moved_to(0.5, 0.5),
+            moved_to(0.8, 0.3, Point2D(0.8, 0.3) - Point2D(0.5, 0.5))
+        ]
 
         comp.dispose()
 
         assert data["completed"]
         assert data["errors"] == []
-        assert data["events"] == [moved_to(0.5, 0.5), moved_to(0.8, 0.3)]
+        assert data["events"] == [
+            moved_to(0.5, 0.5),
+            moved_to(0.8, 0.3, Point2D(0.8, 0.3) - Point2D(0.5, 0.5))
+        ]
+
+
+def test_on_mouse_move_late_subscriber(mouse: SCA_PythonMouse):
+    comp = MouseInputSource()
+
+    comp.start(OrderedDict(()))
+
+    events = []
+
+    comp.on_mouse_move.subscribe(events.append)
+
+    assert events == []
+
+    comp.update()
+
+    mouse.position = (0.8, 0.3)
+
+    comp.update()
+
+    late = []
+
+    comp.on_mouse_move.subscribe(late.append)
+
+    assert late == [events[-1]]
+    assert late[0].position == Point2D(0.8, 0.3)
+
+    mouse.position = (0.6, 0.3)
+
+    comp.update()
+
+    assert late == events[1:]
+
+    comp.dispose()
 
 
 def test_on_mouse_down(mouse: SCA_PythonMouse):
@@ -142,7 +181,7 @@ def test_on_mouse_down(mouse: SCA_PythonMouse):
         data["completed"] = True
 
     def clicked_at(x, y, button, buttons):
-        return MouseDownEvent(comp, MouseState(Point2D(x, y), buttons), button)
+        return MouseDownEvent(comp, MouseState.from_buttons(Point2D(x, y), buttons), button)
 
     with comp.on_mouse_down.subscribe(
             on_next=data["events"].append,
@@ -238,7 +277,7 @@ def test_on_mouse_up(mouse: SCA_PythonMouse):
         data["completed"] = True
 
     def clicked_at(x, y, button, buttons):
-        return MouseUpEvent(comp, MouseState(Point2D(x, y), buttons), button)
+        return MouseUpEvent(comp, MouseState.from_buttons(Point2D(x, y), buttons), button)
 
     with comp.on_mouse_up.subscribe(
             on_next=data["events"].append,
@@ -327,3 +366,144 @@ def test_on_mouse_up(mouse: SCA_PythonMouse):
             clicked_at(0.5, 0.5, MouseButton.LEFT, set()),
             clicked_at(0.6, 0.3, MouseButton.LEFT, {MouseButton.MIDDLE})
         ]
+
+
+def test_mouse_state_buttons():
+    state = MouseState.from_buttons(Point2D(0.5, 0.5), (MouseButton.LEFT, MouseButton.RIGHT))
+
+    assert state.button_mask == MouseButton.LEFT.mask | MouseButton.RIGHT.mask
+    assert state.buttons == {MouseButton.LEFT, MouseButton.RIGHT}
+
+    assert MouseState(Point2D(0.5, 0.5), 0).buttons == set()
+
+
+def test_simultaneous_button_changes(mouse: SCA_PythonMouse):
+    comp = MouseInputSource()
+
+    events = []
+
+    comp.on_mouse_down.subscribe(events.append)
+    comp.on_mouse_up.subscribe(events.append)
+
+    comp.start(OrderedDict(()))
+
+    mouse.activeInputs = {
+        LEFTMOUSE: SCA_InputEvent((KX_INPUT_ACTIVE,))
+    }
+
+    comp.update()
+
+    assert events == []
+
+    mouse.activeInputs = {
+        MIDDLEMOUSE: SCA_InputEvent((KX_INPUT_ACTIVE,))
+    }
+
+    comp.update()
+
+    state = MouseState.from_buttons(Point2D(0.5, 0.5), (MouseButton.MIDDLE,))
+
+    assert events == [
+        MouseUpEvent(comp, state, MouseButton.LEFT),
+        MouseDownEvent(comp, state, MouseButton.MIDDLE)
+    ]
+
+    comp.dispose()
+
+
+def test_event_queue(mouse: SCA_PythonMouse):
+    class QueuedMouseInputSource(MouseInputSource):
+        use_event_queue = True
+
+    comp = QueuedMouseInputSource()
+
+    events = []
+
+    comp.on_mouse_down.subscribe(events.append)
+    comp.on_mouse_up.subscribe(events.append)
+
+    comp.start(OrderedDict(()))
+
+    mouse.activeInputs = {
+        LEFTMOUSE: SCA_InputEvent(
+            (KX_INPUT_JUST_RELEASED,),
+            (KX_INPUT_JUST_ACTIVATED, KX_INPUT_JUST_RELEASED))
+    }
+
+    comp.update()
+
+    def state_of(*buttons):
+        return MouseState.from_buttons(Point2D(0.5, 0.5), buttons)
+
+    assert events == [
+        MouseDownEvent(comp, state_of(MouseButton.LEFT), MouseButton.LEFT),
+        MouseUpEvent(comp, state_of(), MouseButton.LEFT)
+    ]
+
+    events.clear()
+
+    mouse.activeInputs = {
+        LEFTMOUSE: SCA_InputEvent(
+            (KX_INPUT_ACTIVE,),
+            (KX_INPUT_JUST_ACTIVATED, KX_INPUT_JUST_RELEASED, KX_INPUT_JUST_ACTIVATED)),
+        MIDDLEMOUSE: SCA_InputEvent(
+            (KX_INPUT_ACTIVE,),
+            (KX_INPUT_JUST_ACTIVATED,))
+    }
+
+    comp.update()
+
+    assert comp.state.unwrap() == state_of(MouseButton.LEFT, MouseButton.MIDDLE)
+
+    assert events == [
+        MouseDownEvent(comp, state_of(MouseButton.LEFT), MouseButton.LEFT),
+        MouseUpEvent(comp, state_of(), MouseButton.LEFT),
+        MouseDownEvent(comp, state_of(MouseButton.LEFT), MouseButton.LEFT),
+        MouseDownEvent(comp, state_of(MouseButton.LEFT, MouseButton.MIDDLE), MouseButton.MIDDLE)
+    ]
+
+    events.clear()
+
+    mouse.activeInputs = {
+        LEFTMOUSE: SCA_InputEvent((KX_INPUT_ACTIVE,)),
+        MIDDLEMOUSE: SCA_InputEvent((KX_INPUT_ACTIVE,))
+    }
+
+    comp.update()
+
+    assert events == []
+
+    comp.dispose()
+
+
+def test_pooled(mouse: SCA_PythonMouse):
+    pool = ObjectPool(MouseInputSource)
+
+    comp = pool.acquire(OrderedDict(()))
+    comp.update()
+
+    assert pool.release(comp)
+    assert pool.acquire(OrderedDict(())) is comp
+
+    events = []
+
+    comp.on_mouse_move.subscribe(events.append)
+    comp.on_mouse_down.subscribe(events.append)
+
+    comp.update()
+
+    assert events == [MouseMoveEvent(comp, comp.state.unwrap())]
+
+    mouse.position = (0.8, 0.3)
+    mouse.activeInputs = {LEFTMOUSE: SCA_InputEvent((KX_INPUT_ACTIVE,))}
+
+    comp.update()
+
+    state = comp.state.unwrap()
+
+    assert events[1:] == [
+        MouseMoveEvent(comp, state, state.position - Point2D(0.5, 0.5)),
+        MouseDownEvent(comp, state, MouseButton.LEFT)
+    ]
+
+    comp.dispose()
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+from pathlib import Path
+
+from bge.events import AKEY, LEFTMOUSE, SPACEKEY
+from bge.logic import KX_INPUT_ACTIVE, keyboard, mouse
+from pytest import raises
+
+from alleycat.common import Point2D
+from alleycat.core import bootstrap
+from alleycat.input import InputRecord, InputRecorder, KeyboardInputSource, KeyboardState, MouseButton, \
+    MouseInputSource, MouseState, load_records, read_records
+from alleycat.input.recording import MAGIC
+from alleycat.test.mock_bge import SCA_InputEvent
+from alleycat.test.playback import InputPlayer
+
+
+def setup():
+    bootstrap._initialised = True
+
+
+def teardown():
+    bootstrap._initialised = False
+
+
+def record_session(recorder: InputRecorder, frame: list) -> None:
+    mouse_source = MouseInputSource()
+    keyboard_source = KeyboardInputSource()
+
+    mouse.position = (0.5, 0.5)
+    mouse.activeInputs = {}
+
+    keyboard.activeInputs = {}
+
+    mouse_source.start(OrderedDict(()))
+    keyboard_source.start(OrderedDict(()))
+
+    recorder.record_mouse(mouse_source)
+    recorder.record_keyboard(keyboard_source)
+
+    pressed = {LEFTMOUSE: SCA_InputEvent((KX_INPUT_ACTIVE,))}
+    typed = {AKEY: SCA_InputEvent((KX_INPUT_ACTIVE,)), SPACEKEY: SCA_InputEvent((KX_INPUT_ACTIVE,))}
+
+    inputs = (
+        ((0.5, 0.5), {}, {}),
+        ((0.6, 0.4), pressed, {}),
+        ((0.6, 0.4), pressed, {}),
+        ((0.6, 0.4), pressed, {AKEY: SCA_InputEvent((KX_INPUT_ACTIVE,))}),
+        ((0.7, 0.2), {}, typed),
+        ((0.7, 0.2), {}, typed),
+        ((0.7, 0.2), {}, typed),
+    )
+
+    for (position, buttons, keys) in inputs:
+        frame[0] += 1
+
+        mouse.position = position
+        mouse.activeInputs = buttons
+
+        keyboard.activeInputs = keys
+
+        mouse_source.update()
+        keyboard_source.update()
+
+        recorder.update()
+
+    mouse_source.dispose()
+    keyboard_source.dispose()
+
+
+EXPECTED = [
+    InputRecord(1., 0, MouseState(Point2D(0.5, 0.5), 0)),
+    InputRecord(1., 0, KeyboardState(0)),
+    InputRecord(2., 1, MouseState.from_buttons(Point2D(0.6, 0.4), (MouseButton.LEFT,))),
+    InputRecord(4., 3, KeyboardState.from_keys((AKEY,))),
+    InputRecord(5., 4, MouseState(Point2D(0.7, 0.2), 0)),
+    InputRecord(5., 4, KeyboardState.from_keys((AKEY, SPACEKEY))),
+    InputRecord(7., 7, None),
+]
+
+
+def test_recording(tmp_path: Path):
+    frame = [0]
+
+    recorder = InputRecorder(lambda: float(frame[0]))
+
+    record_session(recorder, frame)
+
+    assert recorder.frame == 7
+    assert list(read_records(recorder.data)) == EXPECTED
+
+    path = tmp_path / "input.bin"
+
+    recorder.save(path)
+
+    assert list(load_records(path)) == EXPECTED
+
+    recorder.dispose()
+
+
+def test_playback():
+    frame = [0]
+
+    recorder = InputRecorder(lambda: float(frame[0]))
+
+    record_session(recorder, frame)
+
+    player = InputPlayer(read_records(recorder.data))
+
+    assert len(player) == 7
+
+    mouse_source = MouseInputSource()
+    keyboard_source = KeyboardInputSource()
+
+    mouse_states = []
+    keyboard_states = []
+
+    mouse_source.on_state_change.subscribe(mouse_states.append)
+    keyboard_source.on_state_change.subscribe(keyboard_states.append)
+
+    mouse_source.start(OrderedDict(()))
+    keyboard_source.start(OrderedDict(()))
+
+    frames = []
+
+    for index in player:
+        frames.append(index)
+
+        mouse_source.update()
+        keyboard_source.update()
+
+    assert frames == list(range(7))
+
+    assert mouse_states == [r.state for r in EXPECTED if isinstance(r.state, MouseState)]
+    assert keyboard_states == [r.state for r in EXPECTED if isinstance(r.state, KeyboardState)]
+
+    mouse_source.dispose()
+    keyboard_source.dispose()
+
+    recorder.dispose()
+
+
+def test_truncated_data():
+    frame = [0]
+
+    recorder = InputRecorder(lambda: float(frame[0]))
+
+    record_session(recorder, frame)
+
+    data = recorder.data
+
+    assert list(read_records(data[:-1])) == EXPECTED[:-1]
+    assert list(read_records(data[:-14])) == EXPECTED[:-2]
+    assert list(read_records(data[:-16])) == EXPECTED[:-2]
+    assert list(read_records(data[:len(MAGIC) + 5])) == []
+
+    recorder.dispose()
+
+
+def test_invalid_data():
+    with raises(ValueError, match="Not a valid input recording."):
+        list(read_records(b"INVALID"))
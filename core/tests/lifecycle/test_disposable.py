@@ -1,6 +1,7 @@
 from pytest import raises
-from reactivex import Subject
+from reactivex import Subject, of
 from reactivex.disposable import Disposable
+from reactivex.internal import DisposedException
 
 from alleycat.lifecycle import AlreadyDisposedError, BaseDisposable, DisposableCollection
 
@@ -33,6 +34,49 @@ def test_disposable_collection():
         collection.dispose()
 
 
+def test_disposable_collection_membership():
+    collection = DisposableCollection()
+
+    disposable1 = Disposable()
+    disposable2 = Disposable()
+
+    collection.append(disposable1)
+    collection.append(disposable1)
+
+    assert len(collection) == 1
+    assert disposable1 in collection
+    assert disposable2 not in collection
+
+    assert not collection.remove(disposable2)
+    assert collection.remove(disposable1)
+
+    assert len(collection) == 0
+
+    collection.dispose()
+
+    assert not disposable1.is_disposed
+
+
+def test_disposable_collection_prune():
+    collection = DisposableCollection()
+
+    disposables = [Disposable() for _ in range(DisposableCollection.min_prune_size - 1)]
+
+    for disposable in disposables:
+        collection.append(disposable)
+
+    for disposable in disposables[10:]:
+        disposable.dispose()
+
+    assert len(collection) == DisposableCollection.min_prune_size - 1
+
+    collection.append(Disposable())
+
+    assert len(collection) == 11
+
+    collection.dispose()
+
+
 def test_disposable_collector():
     class TestCollector(BaseDisposable):
         def __init__(self) -> None:
@@ -82,6 +126,35 @@ def test_disposable_collector():
         collector.dispose()
 
 
+def test_disposable_collector_completed():
+    class TestCollector(BaseDisposable):
+        def __init__(self) -> None:
+            super().__init__()
+
+            self.result = []
+
+            self.subject = Subject()
+
+            self._subscribe_until_dispose(
+                self.subject,
+                self.result.append,
+                on_completed=lambda: self.result.append("done"))
+
+            self._subscribe_until_dispose(of("A", "B"), self.result.append)
+
+    collector = TestCollector()
+
+    assert len(collector._disposables) == 1
+
+    collector.subject.on_next("C")
+    collector.subject.on_completed()
+
+    assert collector.result == ["A", "B", "C", "done"]
+    assert len(collector._disposables) == 0
+
+    collector.dispose()
+
+
 def test_base_disposable():
     class TestDisposable(BaseDisposable):
         pass
@@ -107,3 +180,14 @@ def test_base_disposable():
 
     with raises(AlreadyDisposedError):
         disposable.dispose()
+
+
+def test_on_dispose_after_dispose():
+    class TestDisposable(BaseDisposable):
+        pass
+
+    disposable = TestDisposable()
+    disposable.dispose()
+
+    with raises(DisposedException):
+        disposable.on_dispose.subscribe()
@@ -0,0 +1,97 @@
+from typing import Any, OrderedDict
+
+from pytest import raises
+from returns.result import Success
+
+from alleycat.common import IllegalStateError
+from alleycat.lifecycle import ObjectPool, Startable
+
+
+class Projectile(Startable):
+    pass
+
+
+def test_object_pool():
+    created = []
+
+    def create() -> Projectile:
+        projectile = Projectile()
+        created.append(projectile)
+
+        return projectile
+
+    pool = ObjectPool(create, max_size=1)
+
+    first = pool.acquire(OrderedDict[str, Any]((("Speed", 1),)))
+    second = pool.acquire(OrderedDict[str, Any]((("Speed", 2),)))
+
+    assert first.started
+    assert len(created) == 2
+
+    events = []
+
+    first.on_dispose.subscribe(events.append)
+
+    assert pool.release(first)
+    assert not pool.release(second)
+
+    assert events == [None]
+    assert len(pool) == 1
+
+    assert not first.is_disposed
+    assert not first.started
+
+    starts = []
+
+    first.on_start.subscribe(lambda a: starts.append(a["Speed"]))
+
+    reused = pool.acquire(OrderedDict[str, Any]((("Speed", 3),)))
+
+    assert reused is first
+    assert len(created) == 2
+    assert starts == [3]
+    assert reused.start_args.bind(lambda a: a.require("Speed", int)) == Success(3)
+
+    pool.fill(5)
+
+    assert len(pool) == 1
+    assert len(created) == 3
+
+    pool.clear()
+
+    assert len(pool) == 0
+
+    reused.dispose()
+
+
+def test_release_twice():
+    pool = ObjectPool(Projectile)
+
+    projectile = pool.acquire(OrderedDict[str, Any]())
+
+    assert pool.release(projectile)
+
+    with raises(ValueError, match="The object has already been released"):
+        pool.release(projectile)
+
+    assert len(pool) == 1
+
+    first = pool.acquire(OrderedDict[str, Any]())
+    second = pool.acquire(OrderedDict[str, Any]())
+
+    assert first is projectile
+    assert second is not first
+
+    assert pool.release(first)
+
+    first.dispose()
+    second.dispose()
+
+
+def test_reset_without_dispose():
+    projectile = Projectile()
+
+    with raises(IllegalStateError, match="Only a disposed object can be reset."):
+        projectile._reset()
+
+    projectile.dispose()
@@ -86,3 +86,23 @@ def test_start_failure():
     actual_error = startable.start_args.failure()
 
     assert actual_error == expected_error
+
+
+def test_on_start_after_failure():
+    expected_error = BaseException("Something bad happened!")
+
+    class FaultyStartable(Startable):
+
+        def _do_start(self, args: MapReader) -> ResultE[MapReader]:
+            return ResultE[MapReader].from_failure(expected_error)
+
+    startable = FaultyStartable()
+    startable.start(OrderedDict[str, Any](()))
+
+    errors = []
+
+    startable.on_start.subscribe(on_error=errors.append)
+
+    assert errors == [expected_error]
+
+    startable.dispose()
@@ -0,0 +1,115 @@
+from typing import List
+
+from pytest import raises
+
+from alleycat.lifecycle import BaseDisposable, Teardown
+
+
+class Node(BaseDisposable):
+    def __init__(self, name: str, log: List[str], *children: BaseDisposable) -> None:
+        super().__init__()
+
+        self.name = name
+        self.log = log
+
+        for child in children:
+            self._disposables.append(child)
+
+    def dispose(self) -> None:
+        self.log.append(self.name)
+
+        super().dispose()
+
+
+def test_teardown_order():
+    log = []
+
+    shared = Node("shared", log)
+    leaf = Node("leaf", log)
+
+    child1 = Node("child1", log, shared, leaf)
+    child2 = Node("child2", log, shared)
+
+    root = Node("root", log, child1, child2)
+
+    teardown = Teardown((root,))
+
+    assert teardown.total == 5
+
+    teardown.run()
+
+    assert log[0] == "root"
+    assert set(log[1:3]) == {"child1", "child2"}
+    assert set(log[3:]) == {"shared", "leaf"}
+
+    assert all(n.is_disposed for n in (root, child1, child2, shared, leaf))
+    assert teardown.done
+
+
+def test_teardown_across_updates():
+    log = []
+
+    nodes = [Node(str(i), log) for i in range(5)]
+    root = Node("root", log, *nodes)
+
+    completed = []
+
+    teardown = Teardown((root,), max_per_update=2)
+    teardown.on_complete.subscribe(completed.append)
+
+    teardown.update()
+
+    assert log == ["root", "0"]
+    assert teardown.remaining == 4
+    assert not nodes[1].is_disposed
+
+    teardown.update()
+
+    assert completed == []
+
+    teardown.update()
+
+    assert log == ["root"] + [str(i) for i in range(5)]
+    assert completed == [6]
+
+    teardown.update()
+
+    assert log == ["root"] + [str(i) for i in range(5)]
+
+
+def test_teardown_skips_disposed():
+    log = []
+
+    child = Node("child", log)
+    root = Node("root", log, child)
+
+    child.dispose()
+
+    teardown = Teardown((root, child), time_budget=1.)
+    teardown.update()
+
+    assert log == ["child", "root"]
+
+    with raises(ValueError, match="Maximum disposals per update must be a positive integer"):
+        Teardown((), max_per_update=0)
+
+
+def test_teardown_nothing_to_dispose():
+    log = []
+
+    node = Node("node", log)
+    node.dispose()
+
+    for roots in ((), (node,)):
+        completed = []
+
+        teardown = Teardown(roots)
+        teardown.on_complete.subscribe(completed.append)
+
+        assert teardown.done
+        assert teardown.can_update
+
+        teardown.update()
+
+        assert completed == [0]
+        assert not teardown.can_update
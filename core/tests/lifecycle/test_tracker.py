@@ -0,0 +1,67 @@
+import gc
+
+from pytest import raises
+from reactivex import Subject
+
+from alleycat.common import IllegalStateError
+from alleycat.lifecycle import BaseDisposable, LeakTracker
+
+
+class Listener(BaseDisposable):
+    def __init__(self, stream: Subject, received: list) -> None:
+        super().__init__()
+
+        self._subscribe_until_dispose(stream, received.append)
+
+
+def create_listener(stream: Subject, received: list) -> Listener:
+    return Listener(stream, received)
+
+
+def test_leak_tracker():
+    tracker = LeakTracker()
+    tracker.start()
+
+    try:
+        stream = Subject[int]()
+        received = []
+
+        disposed = create_listener(stream, received)
+        leaked = create_listener(stream, received)
+        orphaned = create_listener(stream, received)
+
+        disposed.dispose()
+
+        del orphaned
+        gc.collect()
+
+        (undisposed, orphans) = tracker.report()
+
+        assert [r.type_name for r in undisposed] == ["Listener"]
+        assert undisposed[0].subscriptions == 1
+        assert [f.name for f in undisposed[0].stack][-2:] == ["create_listener", "__init__"]
+        assert "test_tracker.py" in undisposed[0].format()
+
+        assert [r.type_name for r in orphans] == ["Listener"]
+        assert orphans[0].subscriptions == 1
+
+        stream.on_next(1)
+
+        assert received == [1, 1]
+
+        leaked.dispose()
+
+        assert tracker.undisposed == ()
+
+        with raises(IllegalStateError, match="Another leak tracker is already active."):
+            LeakTracker().start()
+    finally:
+        tracker.stop()
+
+    assert not tracker.active
+
+    untracked = Listener(Subject(), [])
+
+    assert tracker.undisposed == ()
+
+    untracked.dispose()
@@ -1,10 +1,11 @@
 from collections import OrderedDict
 
+from pytest import approx, mark
 from returns.result import Result, ResultE, Success
 
 from alleycat.core import BaseObject, bootstrap
 from alleycat.lifecycle import RESULT_DISPOSED, RESULT_NOT_STARTED
-from alleycat.state import StateManager
+from alleycat.state import StateManager, UpdateMode
 
 
 def setup():
@@ -110,3 +111,231 @@ def test_on_state_change():
     assert data["completed"]
     assert data["errors"] == []
     assert data["state"] == [3, 5]
+
+
+def test_on_state_change_without_changes():
+    input_text: str = ""
+
+    class LetterCounter(StateManager[int], BaseObject):
+
+        @property
+        def init_state(self) -> ResultE[int]:
+            return Result.from_value(0)
+
+        def next_state(self, state: int) -> ResultE[int]:
+            return Result.from_value(state + len(input_text))
+
+    counter = LetterCounter()
+
+    state1 = []
+    state2 = []
+
+    counter.on_state_change.subscribe(state1.append)
+    counter.on_state_change.subscribe(state2.append)
+
+    counter.start(OrderedDict(()))
+
+    counter.update()
+    counter.update()
+
+    assert state1 == [0]
+    assert state2 == [0]
+
+    input_text = "abc"
+
+    counter.update()
+
+    input_text = ""
+
+    counter.update()
+    counter.update()
+
+    assert state1 == [0, 3]
+    assert state2 == [0, 3]
+
+    state3 = []
+
+    counter.on_state_change.subscribe(state3.append)
+
+    assert state3 == [3]
+
+    counter.dispose()
+
+
+def test_next_state_unchanged():
+    comparisons = [0]
+
+    class Value:
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+        def __eq__(self, other) -> bool:
+            comparisons[0] += 1
+
+            return isinstance(other, Value) and self.value == other.value
+
+    changed: bool = False
+
+    class ValueManager(StateManager[Value], BaseObject):
+
+        @property
+        def init_state(self) -> ResultE[Value]:
+            return Result.from_value(Value(0))
+
+        def next_state(self, state: Value) -> ResultE[Value]:
+            return Result.from_value(Value(state.value + 1)) if changed else self.state
+
+    manager = ValueManager()
+
+    states = []
+
+    manager.on_state_change.subscribe(lambda s: states.append(s.value))
+    manager.start(OrderedDict(()))
+
+    manager.update()
+    manager.update()
+    manager.update()
+
+    assert states == [0]
+    assert comparisons[0] == 0
+
+    changed = True
+
+    manager.update()
+
+    assert states == [0, 1]
+
+    changed = False
+    comparisons[0] = 0
+
+    manager.update()
+    manager.update()
+
+    assert states == [0, 1]
+    assert comparisons[0] == 0
+
+    manager.dispose()
+
+
+def test_fixed_update():
+    time = [0.]
+
+    class Counter(StateManager[int], BaseObject):
+        update_mode = UpdateMode.Fixed
+
+        update_rate = 4.
+
+        max_steps = 3
+
+        @property
+        def init_state(self) -> ResultE[int]:
+            return Result.from_value(0)
+
+        def next_state(self, state: int) -> ResultE[int]:
+            return Result.from_value(state + 1)
+
+    counter = Counter()
+    counter.timer = lambda: time[0]
+
+    states = []
+
+    counter.on_state_change.subscribe(states.append)
+    counter.start(OrderedDict(()))
+
+    counter.update()
+
+    assert states == [1]
+    assert counter.alpha == 0.
+
+    time[0] = 0.125
+
+    counter.update()
+
+    assert states == [1]
+    assert counter.alpha == approx(0.5)
+
+    time[0] = 0.625
+
+    counter.update()
+
+    assert states == [1, 2, 3]
+    assert counter.alpha == approx(0.5)
+
+    time[0] = 2.8125
+
+    counter.update()
+
+    assert states == [1, 2, 3, 4, 5, 6]
+    assert counter.alpha == approx(0.25)
+
+    counter.dispose()
+
+
+def test_reduced_update():
+    time = [0.]
+
+    class Counter(StateManager[int], BaseObject):
+        update_mode = UpdateMode.Reduced
+
+        update_rate = 10.
+
+        @property
+        def init_state(self) -> ResultE[int]:
+            return Result.from_value(0)
+
+        def next_state(self, state: int) -> ResultE[int]:
+            return Result.from_value(state + 1)
+
+    counter = Counter()
+    counter.timer = lambda: time[0]
+
+    states = []
+
+    counter.on_state_change.subscribe(states.append)
+    counter.start(OrderedDict(()))
+
+    for frame in range(61):
+        time[0] = frame / 60
+        counter.update()
+
+    assert states == list(range(1, 12))
+    assert counter.alpha == 1.
+
+    time[0] = 5.
+
+    counter.update()
+
+    assert states[-1] == 12
+
+    counter.dispose()
+
+
+@mark.parametrize("mode", (UpdateMode.Frame, UpdateMode.Fixed, UpdateMode.Reduced))
+def test_first_update(mode: UpdateMode):
+    class Counter(StateManager[int], BaseObject):
+        update_mode = mode
+
+        @property
+        def init_state(self) -> ResultE[int]:
+            return Result.from_value(0)
+
+        def next_state(self, state: int) -> ResultE[int]:
+            return Result.from_value(state + 1)
+
+    counter = Counter()
+    counter.timer = lambda: 0.
+
+    states = []
+
+    counter.on_state_change.subscribe(states.append)
+    counter.start(OrderedDict(()))
+
+    assert states == []
+
+    counter.update()
+
+    assert states == [1]
+    assert counter.state == Success(1)
+    assert counter.alpha == (0. if mode == UpdateMode.Fixed else 1.)
+
+    counter.dispose()